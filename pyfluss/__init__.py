@@ -31,9 +31,26 @@ from .version import __version__
 # Schema and configuration API
 from .api import Schema
 
-# Low-level API (for advanced users)
-from .py4j import Catalog, Table, ReadBuilder, TableScan, Plan, RowType
-from .py4j import FlussTableRead, BatchWriteBuilder, BatchTableWrite, FlussSchema
+# Low-level API (for advanced users), loaded on first access since the py4j
+# implementation imports pandas and pyarrow
+_LAZY_PY4J_EXPORTS = (
+    'Catalog', 'Table', 'ReadBuilder', 'TableScan', 'Plan', 'RowType',
+    'FlussTableRead', 'BatchWriteBuilder', 'BatchTableWrite', 'FlussSchema'
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_PY4J_EXPORTS:
+        from . import py4j
+        value = getattr(py4j, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_PY4J_EXPORTS))
+
 
 # Main exports - high-level API first
 __all__ = [
@@ -23,7 +23,7 @@ from .read_builder import ReadBuilder
 from .table_scan import TableScan, Plan
 from .fluss_table_read import FlussTableRead
 from .write_builder import WriteBuilder, BatchWriteBuilder
-from .table_write import TableWrite, BatchTableWrite
+from .table_write import TableWrite, BatchTableWrite, BufferedBatchTableWrite
 from .row_type import RowType
 from .metadata import DatabaseDescriptor, TablePath
 from .admin import Admin
@@ -42,6 +42,7 @@ __all__ = [
     'BatchWriteBuilder',
     'TableWrite',
     'BatchTableWrite',
+    'BufferedBatchTableWrite',
     'RowType',
     'DatabaseDescriptor',
     'TablePath',
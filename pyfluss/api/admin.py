@@ -16,9 +16,15 @@
 # limitations under the License.
 ################################################################################
 
-from typing import Optional, Dict
+import concurrent.futures
+from typing import Any, Dict, List, Optional, Tuple
 from .metadata import DatabaseDescriptor
 
+# Must match org.example.FlussPy4JUtils.SEPARATOR
+_ENTRY_SEPARATOR = '\x00'
+
+_TABLE_PATH_CACHE_SIZE = 1024
+
 
 class Admin:
     """
@@ -38,9 +44,20 @@ class Admin:
         self._java_admin = java_admin
         self._gateway = gateway
         self._connection_manager = connection_manager
+        
+        # Java class handles shared by every user of this gateway
+        # Imported here so that loading pyfluss.api does not pull in the py4j layer
+        from pyfluss.py4j.util.jvm_cache import get_jvm_classes
+        self._j_classes = get_jvm_classes(gateway)
+        
+        # 'database.table' string -> Java TablePath, reused across DDL calls
+        self._table_path_cache: Dict[str, object] = {}
+        
+        # Java descriptor for databases created without comment or properties
+        self._default_java_database_descriptor = None
     
     def create_database(self, database_name: str, database_descriptor: Optional[DatabaseDescriptor] = None,
-                       if_not_exists: bool = True):
+                       if_not_exists: bool = True, async_: bool = False):
         """
         Create a database.
         
@@ -48,33 +65,17 @@ class Admin:
             database_name: Name of the database to create
             database_descriptor: Optional DatabaseDescriptor object
             if_not_exists: Whether to ignore if database already exists
+            async_: Return a Future instead of waiting for the operation
             
         Returns:
-            True if successful
+            True if successful, or a Future resolving to True if async_ is set
         """
-        # If no descriptor provided, create a default one
-        if database_descriptor is None:
-            database_descriptor = DatabaseDescriptor()
-        
-        # Create Java DatabaseDescriptor
-        java_builder = self._gateway.jvm.com.alibaba.fluss.metadata.DatabaseDescriptor.builder()
-        
-        if database_descriptor.comment:
-            java_builder = java_builder.comment(database_descriptor.comment)
-        
-        if database_descriptor.custom_properties:
-            java_map = self._gateway.jvm.java.util.HashMap()
-            for key, value in database_descriptor.custom_properties.items():
-                java_map.put(key, value)
-            java_builder = java_builder.customProperties(java_map)
-        
-        java_database_descriptor = java_builder.build()
+        java_database_descriptor = self._to_java_database_descriptor(database_descriptor)
         
         def create_operation():
             return self._java_admin.createDatabase(database_name, java_database_descriptor, if_not_exists)
         
-        self._connection_manager._handle_async_operation_with_retry(create_operation)
-        return True
+        return self._execute(create_operation, async_)
     
     def list_databases(self):
         """
@@ -88,20 +89,10 @@ class Admin:
         
         databases = self._connection_manager._handle_async_operation_with_retry(list_operation)
         
-        # Convert Java collection to Python list
-        result = []
-        try:
-            iterator = databases.iterator()
-            while iterator.hasNext():
-                result.append(str(iterator.next()))
-        except:
-            try:
-                result = [str(db) for db in databases]
-            except:
-                result = []
-        return result
+        return self._to_python_list(databases)
     
-    def drop_database(self, database_name: str, cascade: bool = False, if_exists: bool = True):
+    def drop_database(self, database_name: str, cascade: bool = False, if_exists: bool = True,
+                      async_: bool = False):
         """
         Drop a database.
         
@@ -109,15 +100,18 @@ class Admin:
             database_name: Name of the database to drop
             cascade: Whether to drop all tables in the database
             if_exists: Whether to ignore if database doesn't exist
+            async_: Return a Future instead of waiting for the operation
             
         Returns:
-            True if successful
+            True if successful, or a Future resolving to True if async_ is set
         """
         def drop_operation():
             return self._java_admin.dropDatabase(database_name, cascade, if_exists)
         
-        self._connection_manager._handle_async_operation_with_retry(drop_operation)
-        return True
+        def evict_writers():
+            self._connection_manager._evict_data_writers(database_name)
+        
+        return self._execute(drop_operation, async_, evict_writers)
     
     def list_tables(self, database_name: str):
         """
@@ -134,20 +128,9 @@ class Admin:
         
         tables = self._connection_manager._handle_async_operation_with_retry(list_operation)
         
-        # Convert Java collection to Python list
-        result = []
-        try:
-            iterator = tables.iterator()
-            while iterator.hasNext():
-                result.append(str(iterator.next()))
-        except:
-            try:
-                result = [str(table) for table in tables]
-            except:
-                result = []
-        return result
+        return self._to_python_list(tables)
     
-    def create_table(self, table_path, table_descriptor, if_not_exists: bool = True):
+    def create_table(self, table_path, table_descriptor, if_not_exists: bool = True, async_: bool = False):
         """
         Create a table.
         
@@ -155,58 +138,150 @@ class Admin:
             table_path: TablePath object or string
             table_descriptor: Table descriptor
             if_not_exists: Whether to ignore if table already exists
+            async_: Return a Future instead of waiting for the operation
             
         Returns:
-            True if successful
+            True if successful, or a Future resolving to True if async_ is set
         """
-        # Convert string table path to Java TablePath if needed
-        if isinstance(table_path, str):
-            parts = table_path.split('.')
-            if len(parts) == 2:
-                database_name, table_name = parts
-                java_table_path = self._gateway.jvm.com.alibaba.fluss.metadata.TablePath.of(database_name, table_name)
-            else:
-                raise ValueError("Table path must be in format 'database.table'")
-        else:
-            # Assume it's already a Java TablePath or our TablePath
-            if hasattr(table_path, 'to_java'):
-                java_table_path = table_path.to_java(self._gateway)
-            else:
-                java_table_path = table_path
+        java_table_path = self._resolve_table_path(table_path)
         
         def create_operation():
             return self._java_admin.createTable(java_table_path, table_descriptor, if_not_exists)
         
-        self._connection_manager._handle_async_operation_with_retry(create_operation)
-        return True
+        return self._execute(create_operation, async_)
     
-    def drop_table(self, table_path, if_exists: bool = True):
+    def drop_table(self, table_path, if_exists: bool = True, async_: bool = False):
         """
         Drop a table.
         
         Args:
             table_path: TablePath object or string
             if_exists: Whether to ignore if table doesn't exist
+            async_: Return a Future instead of waiting for the operation
             
         Returns:
-            True if successful
+            True if successful, or a Future resolving to True if async_ is set
         """
-        # Convert string table path to Java TablePath if needed
-        if isinstance(table_path, str):
-            parts = table_path.split('.')
-            if len(parts) == 2:
-                database_name, table_name = parts
-                java_table_path = self._gateway.jvm.com.alibaba.fluss.metadata.TablePath.of(database_name, table_name)
-            else:
-                raise ValueError("Table path must be in format 'database.table'")
-        else:
-            if hasattr(table_path, 'to_java'):
-                java_table_path = table_path.to_java(self._gateway)
-            else:
-                java_table_path = table_path
+        java_table_path = self._resolve_table_path(table_path)
         
         def drop_operation():
             return self._java_admin.dropTable(java_table_path, not if_exists)  # ignoreIfNotExists = !if_exists
         
-        self._connection_manager._handle_async_operation_with_retry(drop_operation)
+        def evict_writer():
+            self._connection_manager._evict_data_writers(
+                java_table_path.getDatabaseName(), java_table_path.getTableName())
+        
+        return self._execute(drop_operation, async_, evict_writer)
+    
+    def create_tables_bulk(self, tables: List[Tuple[Any, Any]], if_not_exists: bool = True):
+        """
+        Create several tables concurrently and wait for all of them.
+        
+        Args:
+            tables: List of (table_path, table_descriptor) pairs
+            if_not_exists: Whether to ignore if a table already exists
+            
+        Returns:
+            True if all tables were created
+        """
+        futures = [self.create_table(table_path, table_descriptor, if_not_exists, async_=True)
+                   for table_path, table_descriptor in tables]
+        concurrent.futures.wait(futures)
+        for future in futures:
+            # Re-raises the first failure
+            future.result()
         return True
+    
+    def _execute(self, operation, async_: bool = False, on_success=None):
+        """
+        Run an admin operation with retry, optionally in the background.
+        
+        Args:
+            operation: Function that returns a Java CompletableFuture
+            async_: Whether to return a Future instead of waiting
+            on_success: Optional function run once the operation has completed
+            
+        Returns:
+            True, or a Future resolving to True if async_ is set
+        """
+        def run():
+            self._connection_manager._handle_async_operation_with_retry(operation)
+            if on_success is not None:
+                on_success()
+            return True
+        
+        if async_:
+            return self._connection_manager._submit_async(run)
+        return run()
+    
+    def _to_java_database_descriptor(self, database_descriptor: Optional[DatabaseDescriptor]):
+        """
+        Convert a DatabaseDescriptor to a Java DatabaseDescriptor.
+        
+        Args:
+            database_descriptor: DatabaseDescriptor object or None
+            
+        Returns:
+            Java DatabaseDescriptor object
+        """
+        comment = database_descriptor.comment if database_descriptor is not None else None
+        custom_properties = database_descriptor.custom_properties if database_descriptor is not None else None
+        
+        if not comment and not custom_properties:
+            # The common case: build the empty descriptor once and reuse it
+            if self._default_java_database_descriptor is None:
+                self._default_java_database_descriptor = self._j_classes.DatabaseDescriptor.builder().build()
+            return self._default_java_database_descriptor
+        
+        java_builder = self._j_classes.DatabaseDescriptor.builder()
+        
+        if comment:
+            java_builder = java_builder.comment(comment)
+        
+        if custom_properties:
+            # Ship the whole map in a single call rather than one put() per entry
+            encoded = _ENTRY_SEPARATOR.join(
+                str(item) for entry in custom_properties.items() for item in entry)
+            java_builder = java_builder.customProperties(self._j_classes.FlussPy4JUtils.buildStringMap(encoded))
+        
+        return java_builder.build()
+    
+    def _resolve_table_path(self, table_path):
+        """
+        Convert a table path argument to a Java TablePath.
+        
+        Args:
+            table_path: 'database.table' string, TablePath object or Java TablePath
+            
+        Returns:
+            Java TablePath object
+        """
+        if not isinstance(table_path, str):
+            # Assume it's already a Java TablePath or our TablePath
+            if hasattr(table_path, 'to_java'):
+                return table_path.to_java(self._gateway)
+            return table_path
+        
+        java_table_path = self._table_path_cache.get(table_path)
+        if java_table_path is None:
+            parts = table_path.split('.')
+            if len(parts) != 2:
+                raise ValueError("Table path must be in format 'database.table'")
+            if len(self._table_path_cache) >= _TABLE_PATH_CACHE_SIZE:
+                self._table_path_cache.clear()
+            java_table_path = self._j_classes.TablePath.of(parts[0], parts[1])
+            self._table_path_cache[table_path] = java_table_path
+        return java_table_path
+    
+    def _to_python_list(self, java_collection):
+        """
+        Convert a Java collection of names to a Python list in one Py4J call.
+        
+        Args:
+            java_collection: Java collection returned by the admin client
+            
+        Returns:
+            List of strings
+        """
+        encoded = self._j_classes.FlussPy4JUtils.joinToString(java_collection)
+        return encoded.split(_ENTRY_SEPARATOR) if encoded else []
@@ -16,10 +16,19 @@
 # limitations under the License.
 ################################################################################
 
+import itertools
+import operator
 from abc import ABC, abstractmethod
-from typing import List, Optional, Iterator, Any, Dict
-import pandas as pd
-import pyarrow as pa
+from typing import List, Optional, Iterator, Any, Dict, Sequence, TYPE_CHECKING
+
+# pandas and pyarrow are imported where they are used, so that importing this
+# module stays cheap for callers that never convert data
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# Number of records read when no explicit limit is given
+_DEFAULT_READ_LIMIT = 1000
 
 
 class FlussTableBucket:
@@ -47,6 +56,9 @@ class FlussTableRead(ABC):
     TableBucket concept instead of Split.
     """
 
+    def __init__(self):
+        self._schema_info_cache = None
+
     @abstractmethod
     def read_records(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -73,7 +85,30 @@ class FlussTableRead(ABC):
         """
         pass
 
-    def to_pandas(self, limit: Optional[int] = None) -> pd.DataFrame:
+    @abstractmethod
+    def read_arrow_batches(self, batch_size: int = 1000) -> Iterator['pa.RecordBatch']:
+        """
+        Read records in batches as Arrow record batches.
+        
+        Args:
+            batch_size: Number of records per batch
+            
+        Yields:
+            Arrow RecordBatch objects
+        """
+        pass
+
+    @abstractmethod
+    def native_schema(self) -> 'pa.Schema':
+        """
+        Get the table schema as an Arrow schema without reading data.
+        
+        Returns:
+            PyArrow Schema
+        """
+        pass
+
+    def to_pandas(self, limit: Optional[int] = None) -> 'pd.DataFrame':
         """
         Convert table data to Pandas DataFrame.
         
@@ -84,17 +119,21 @@ class FlussTableRead(ABC):
             Pandas DataFrame
         """
         try:
-            records = self.read_records(limit)
-            if not records:
-                return pd.DataFrame()
-            
-            # Convert records to DataFrame
-            return pd.DataFrame(records)
-            
+            import pandas as pd
         except ImportError:
             raise ImportError("pandas is required for to_pandas(). Install with: pip install pandas")
+        
+        try:
+            import pyarrow as pa
+            return self.to_arrow(limit).to_pandas()
+        except ImportError:
+            pass
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Columns mixing value types, which only pandas accepts
+            pass
+        return pd.DataFrame(self.read_records(limit))
 
-    def to_arrow(self, limit: Optional[int] = None) -> pa.Table:
+    def to_arrow(self, limit: Optional[int] = None) -> 'pa.Table':
         """
         Convert table data to PyArrow Table.
         
@@ -105,14 +144,17 @@ class FlussTableRead(ABC):
             PyArrow Table
         """
         try:
-            # First convert to pandas, then to arrow
-            df = self.to_pandas(limit)
-            return pa.Table.from_pandas(df)
+            import pyarrow as pa
+            # Same amount of data as read_records(limit): a single batch
+            record_batch = next(self.read_arrow_batches(limit or _DEFAULT_READ_LIMIT), None)
+            if record_batch is None:
+                return pa.table({})
+            return pa.Table.from_batches([record_batch])
             
         except ImportError:
             raise ImportError("pyarrow is required for to_arrow(). Install with: pip install pyarrow")
 
-    def to_arrow_batch_reader(self, batch_size: int = 1000) -> pa.RecordBatchReader:
+    def to_arrow_batch_reader(self, batch_size: int = 1000) -> 'pa.RecordBatchReader':
         """
         Convert table data to Arrow batch reader.
         
@@ -123,22 +165,17 @@ class FlussTableRead(ABC):
             Arrow RecordBatchReader
         """
         try:
-            def batch_generator():
-                for batch_records in self.read_batch(batch_size):
-                    if batch_records:
-                        batch_df = pd.DataFrame(batch_records)
-                        yield pa.RecordBatch.from_pandas(batch_df)
-            
-            # Get schema from first batch
-            first_batch_records = next(self.read_batch(1), [])
-            if not first_batch_records:
+            import pyarrow as pa
+            # Peek the first batch for the schema and hand it back out, since
+            # the underlying reader cannot be rewound
+            batches = self.read_arrow_batches(batch_size)
+            first_batch = next(batches, None)
+            if first_batch is None:
                 # Empty table
-                schema = pa.schema([])
-            else:
-                sample_df = pd.DataFrame(first_batch_records)
-                schema = pa.Schema.from_pandas(sample_df)
+                return pa.RecordBatchReader.from_batches(pa.schema([]), iter([]))
             
-            return pa.RecordBatchReader.from_batches(schema, batch_generator())
+            return pa.RecordBatchReader.from_batches(
+                first_batch.schema, itertools.chain([first_batch], batches))
             
         except ImportError:
             raise ImportError("pyarrow is required for to_arrow_batch_reader(). Install with: pip install pyarrow")
@@ -196,11 +233,24 @@ class FlussTableRead(ABC):
         Returns:
             Total record count
         """
+        count = self._native_count()
+        if count is not None:
+            return count
+        
         count = 0
         for batch in self.read_batch():
             count += len(batch)
         return count
 
+    def _native_count(self) -> Optional[int]:
+        """
+        Count records without reading them, if the backend supports it.
+        
+        Returns:
+            Total record count, or None to fall back to reading every batch
+        """
+        return None
+
     def sample(self, n: int = 10) -> List[Dict[str, Any]]:
         """
         Get a sample of records from the table.
@@ -215,25 +265,19 @@ class FlussTableRead(ABC):
 
     def schema_info(self) -> Dict[str, Any]:
         """
-        Get schema information from sample data.
+        Get schema information from the table's Arrow schema.
         
         Returns:
             Schema information dictionary
         """
-        sample_records = self.sample(1)
-        if not sample_records:
-            return {"columns": [], "dtypes": {}}
-        
-        sample_record = sample_records[0]
-        dtypes = {}
-        for key, value in sample_record.items():
-            dtypes[key] = type(value).__name__
-        
-        return {
-            "columns": list(sample_record.keys()),
-            "dtypes": dtypes,
-            "sample_record": sample_record
-        }
+        # The schema of a read does not change, so compute this once
+        if self._schema_info_cache is None:
+            schema = self.native_schema()
+            self._schema_info_cache = {
+                "columns": schema.names,
+                "dtypes": {field.name: str(field.type) for field in schema}
+            }
+        return self._schema_info_cache
 
 
 class FlussTableReadImpl(FlussTableRead):
@@ -250,22 +294,114 @@ class FlussTableReadImpl(FlussTableRead):
         Args:
             fluss_reader: The underlying Fluss data reader
         """
+        super().__init__()
         self._fluss_reader = fluss_reader
+        self._native_schema = fluss_reader.get_arrow_schema()
     
     def read_records(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Read records using the Fluss reader."""
-        return self._fluss_reader.read_rows(limit or 1000)
+        return self._fluss_reader.read_rows(limit or _DEFAULT_READ_LIMIT)
     
     def read_batch(self, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
-        """Read records in batches using the Fluss reader."""
+        """
+        Read records in batches using the Fluss reader.
+        
+        The Java reader has no cursor, so each read rescans the table from the
+        start with a doubled limit and only the new records are yielded (see
+        _read_pages). Reading n records therefore scans between 2n and 4n
+        records over about log2(n / batch_size) reads. Batches are only correct
+        if repeated scans return records in the same order; a table written to
+        while it is being read may yield duplicated or skipped records.
+        
+        Args:
+            batch_size: Number of records per batch
+            
+        Yields:
+            Batches of records
+        """
+        yield from self._read_pages(batch_size)
+    
+    def _read_pages(self, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Read every record once, split into batches of at most batch_size.
+        
+        Each Java read starts a new limited scan from the beginning, so there
+        is no cursor to advance. Instead the limit doubles on every read and
+        only the records past those already handed out are yielded; a read
+        that returns fewer records than its limit has reached the end.
+        
+        Args:
+            batch_size: Number of records per batch
+            
+        Yields:
+            Batches of records
+        """
+        consumed = 0
+        limit = batch_size
         while True:
-            batch = self._fluss_reader.read_rows(batch_size)
-            if not batch:
-                break
-            yield batch
+            records = self._fluss_reader.read_rows(limit)
+            for start in range(consumed, len(records), batch_size):
+                yield records[start:start + batch_size]
+            if len(records) < limit:
+                return
+            consumed = len(records)
+            limit *= 2
+    
+    def read_arrow_batches(self, batch_size: int = 1000) -> Iterator['pa.RecordBatch']:
+        """Read records in batches and build each batch column by column."""
+        for batch in self.read_batch(batch_size):
+            yield _records_to_arrow_batch(batch)
+    
+    def native_schema(self) -> 'pa.Schema':
+        """Get the Arrow schema mapped from the table's RowType."""
+        return self._native_schema
+    
+    def _native_count(self) -> Optional[int]:
+        """Count records on the Java side when the reader supports it."""
+        if hasattr(self._fluss_reader, 'count'):
+            return self._fluss_reader.count()
+        return None
     
     def to_record_generator(self) -> Iterator[Dict[str, Any]]:
         """Generate records one by one."""
-        for batch in self.read_batch():
-            for record in batch:
-                yield record
+        return itertools.chain.from_iterable(self.read_batch())
+
+
+def _records_to_columns(records: List[Dict[str, Any]], names: List[str]) -> List[Sequence[Any]]:
+    """
+    Transpose records into one value sequence per column.
+    
+    Args:
+        records: List of records
+        names: Column names to extract
+        
+    Returns:
+        List of column value sequences, in the order of names
+    """
+    try:
+        # itemgetter/zip run the per-row work in C rather than the interpreter
+        if len(names) == 1:
+            return [list(map(operator.itemgetter(names[0]), records))]
+        return list(zip(*map(operator.itemgetter(*names), records)))
+    except KeyError:
+        # Records with missing keys get nulls for those columns
+        return [[record.get(name) for record in records] for name in names]
+
+
+def _records_to_arrow_batch(records: List[Dict[str, Any]]) -> 'pa.RecordBatch':
+    """
+    Transpose a list of records into an Arrow record batch.
+    
+    Args:
+        records: Non-empty list of records
+        
+    Returns:
+        Arrow RecordBatch with one column per key found in any record, in
+        first-seen order; records without a key get a null in that column
+    """
+    import pyarrow as pa
+    names = list(dict.fromkeys(itertools.chain.from_iterable(records)))
+    if not names:
+        return pa.RecordBatch.from_pydict({})
+    columns = _records_to_columns(records, names)
+    return pa.RecordBatch.from_arrays([pa.array(column) for column in columns], names=names)
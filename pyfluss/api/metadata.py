@@ -16,7 +16,17 @@
 # limitations under the License.
 ################################################################################
 
-from typing import Dict, Optional
+import sys
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+# Shared read-only view returned for descriptors without custom properties
+_EMPTY_PROPERTIES: Mapping[str, str] = MappingProxyType({})
+
+
+def _intern(name):
+    """Intern a name so repeated catalog/database names share one object."""
+    return sys.intern(name) if type(name) is str else name
 
 
 class DatabaseDescriptor:
@@ -24,6 +34,8 @@ class DatabaseDescriptor:
     Descriptor for database metadata including name, comment, and custom properties.
     """
     
+    __slots__ = ('_comment', '_custom_properties')
+    
     def __init__(self, comment: Optional[str] = None, custom_properties: Optional[Dict[str, str]] = None):
         """
         Initialize a DatabaseDescriptor.
@@ -33,7 +45,9 @@ class DatabaseDescriptor:
             custom_properties: Optional custom properties as key-value pairs
         """
         self._comment = comment
-        self._custom_properties = custom_properties or {}
+        # None until properties are set, so the common empty case allocates nothing.
+        # Copied so later changes to the caller's dict (or builder) don't leak in.
+        self._custom_properties = dict(custom_properties) if custom_properties else None
     
     @property
     def comment(self) -> Optional[str]:
@@ -41,9 +55,11 @@ class DatabaseDescriptor:
         return self._comment
     
     @property
-    def custom_properties(self) -> Dict[str, str]:
-        """Get the custom properties."""
-        return self._custom_properties.copy()
+    def custom_properties(self) -> Mapping[str, str]:
+        """Get a read-only view of the custom properties."""
+        if self._custom_properties is None:
+            return _EMPTY_PROPERTIES
+        return MappingProxyType(self._custom_properties)
     
     def with_comment(self, comment: str) -> 'DatabaseDescriptor':
         """
@@ -55,7 +71,8 @@ class DatabaseDescriptor:
         Returns:
             New DatabaseDescriptor instance
         """
-        return DatabaseDescriptor(comment=comment, custom_properties=self._custom_properties)
+        # Descriptors never mutate their properties, so the dict can be shared
+        return DatabaseDescriptor._from_owned(comment, self._custom_properties)
     
     def with_custom_property(self, key: str, value: str) -> 'DatabaseDescriptor':
         """
@@ -68,9 +85,8 @@ class DatabaseDescriptor:
         Returns:
             New DatabaseDescriptor instance
         """
-        new_properties = self._custom_properties.copy()
-        new_properties[key] = value
-        return DatabaseDescriptor(comment=self._comment, custom_properties=new_properties)
+        new_properties = {**(self._custom_properties or _EMPTY_PROPERTIES), key: value}
+        return DatabaseDescriptor._from_owned(self._comment, new_properties)
     
     def with_custom_properties(self, properties: Dict[str, str]) -> 'DatabaseDescriptor':
         """
@@ -82,9 +98,22 @@ class DatabaseDescriptor:
         Returns:
             New DatabaseDescriptor instance
         """
-        new_properties = self._custom_properties.copy()
-        new_properties.update(properties)
-        return DatabaseDescriptor(comment=self._comment, custom_properties=new_properties)
+        new_properties = {**(self._custom_properties or _EMPTY_PROPERTIES), **properties}
+        return DatabaseDescriptor._from_owned(self._comment, new_properties)
+    
+    @classmethod
+    def _from_owned(cls, comment: Optional[str],
+                    custom_properties: Optional[Dict[str, str]]) -> 'DatabaseDescriptor':
+        """
+        Create a DatabaseDescriptor that takes ownership of a properties dict.
+        
+        The dict is stored as-is without going through __init__; callers must
+        not modify it afterwards.
+        """
+        descriptor = cls.__new__(cls)
+        descriptor._comment = comment
+        descriptor._custom_properties = custom_properties
+        return descriptor
     
     @staticmethod
     def builder() -> 'DatabaseDescriptorBuilder':
@@ -97,7 +126,7 @@ class DatabaseDescriptor:
         return DatabaseDescriptorBuilder()
     
     def __repr__(self):
-        return f"DatabaseDescriptor(comment={self._comment!r}, custom_properties={self._custom_properties!r})"
+        return f"DatabaseDescriptor(comment={self._comment!r}, custom_properties={dict(self.custom_properties)!r})"
 
 
 class DatabaseDescriptorBuilder:
@@ -105,9 +134,11 @@ class DatabaseDescriptorBuilder:
     Builder for DatabaseDescriptor instances.
     """
     
+    __slots__ = ('_comment', '_custom_properties')
+    
     def __init__(self):
         self._comment = None
-        self._custom_properties = {}
+        self._custom_properties = None
     
     def comment(self, comment: str) -> 'DatabaseDescriptorBuilder':
         """
@@ -133,6 +164,8 @@ class DatabaseDescriptorBuilder:
         Returns:
             This builder instance
         """
+        if self._custom_properties is None:
+            self._custom_properties = {}
         self._custom_properties[key] = value
         return self
     
@@ -146,6 +179,8 @@ class DatabaseDescriptorBuilder:
         Returns:
             This builder instance
         """
+        if self._custom_properties is None:
+            self._custom_properties = {}
         self._custom_properties.update(properties)
         return self
     
@@ -164,6 +199,8 @@ class TablePath:
     Represents a table path in the format database.table or catalog.database.table.
     """
     
+    __slots__ = ('_catalog_name', '_database_name', '_table_name', '_str', '_hash')
+    
     def __init__(self, database_name: str, table_name: str, catalog_name: Optional[str] = None):
         """
         Initialize a TablePath.
@@ -173,9 +210,15 @@ class TablePath:
             table_name: Table name
             catalog_name: Optional catalog name
         """
-        self._catalog_name = catalog_name
-        self._database_name = database_name
-        self._table_name = table_name
+        self._catalog_name = _intern(catalog_name)
+        self._database_name = _intern(database_name)
+        self._table_name = _intern(table_name)
+        # Fields never change after construction, so format the path once
+        if catalog_name:
+            self._str = f"{catalog_name}.{database_name}.{table_name}"
+        else:
+            self._str = f"{database_name}.{table_name}"
+        self._hash = hash((catalog_name, database_name, table_name))
     
     @property
     def catalog_name(self) -> Optional[str]:
@@ -228,13 +271,21 @@ class TablePath:
         Returns:
             String representation of the table path
         """
-        if self._catalog_name:
-            return f"{self._catalog_name}.{self._database_name}.{self._table_name}"
-        else:
-            return f"{self._database_name}.{self._table_name}"
+        return self._str
+    
+    def __eq__(self, other):
+        if not isinstance(other, TablePath):
+            return NotImplemented
+        return (self._hash == other._hash
+                and self._database_name == other._database_name
+                and self._table_name == other._table_name
+                and self._catalog_name == other._catalog_name)
+    
+    def __hash__(self):
+        return self._hash
     
     def __str__(self):
-        return self.to_string()
+        return self._str
     
     def __repr__(self):
         return f"TablePath(catalog_name={self._catalog_name!r}, database_name={self._database_name!r}, table_name={self._table_name!r})"
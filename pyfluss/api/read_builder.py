@@ -30,6 +30,8 @@ class ReadBuilder(ABC):
     Abstract base class for read builder operations.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def with_projection(self, projection: List[str]) -> 'ReadBuilder':
         """
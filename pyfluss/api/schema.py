@@ -16,8 +16,19 @@
 # limitations under the License.
 ################################################################################
 
+import functools
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+_DECIMAL_RE = re.compile(r'decimal\((\d+),?\s*(\d+)?\)')
+_TS_RE = re.compile(r'timestamp\[(.+)\]')
+
+# Basic type name -> PyArrow type, built lazily since PyArrow is optional
+_TYPE_MAPPING: Optional[Dict[str, Any]] = None
+
+# Marks a cached value that has not been computed yet, since None is a valid result
+_UNSET = object()
 
 
 class Schema(ABC):
@@ -26,6 +37,8 @@ class Schema(ABC):
     Provides interface for schema operations and conversions.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_field_names(self) -> List[str]:
         """
@@ -154,6 +167,9 @@ class ArrowSchema(Schema):
     Schema implementation based on PyArrow schema.
     """
     
+    __slots__ = ('_arrow_schema', '_names', '_names_set', '_name_to_index',
+                 '_field_info_cache', '_field_types_cache', '_primary_keys_cache')
+    
     def __init__(self, arrow_schema):
         """
         Initialize ArrowSchema from PyArrow schema.
@@ -170,7 +186,13 @@ class ArrowSchema(Schema):
             raise ValueError("Input must be a PyArrow Schema object")
             
         self._arrow_schema = arrow_schema
+        # pa.Schema.names builds a new list on every access
+        self._names = tuple(arrow_schema.names)
+        self._names_set = frozenset(self._names)
+        self._name_to_index = None
         self._field_info_cache = {}
+        self._field_types_cache = None
+        self._primary_keys_cache = _UNSET
     
     def get_field_names(self) -> List[str]:
         """
@@ -179,7 +201,7 @@ class ArrowSchema(Schema):
         Returns:
             List of field names
         """
-        return self._arrow_schema.names
+        return list(self._names)
     
     def get_field_types(self) -> Dict[str, str]:
         """
@@ -188,7 +210,11 @@ class ArrowSchema(Schema):
         Returns:
             Dictionary of field name to type mappings
         """
-        return {name: str(field.type) for name, field in zip(self._arrow_schema.names, self._arrow_schema)}
+        if self._field_types_cache is None:
+            self._field_types_cache = dict(zip(self._names,
+                                               [str(field.type) for field in self._arrow_schema]))
+        # A copy, so callers cannot change the cached mapping
+        return dict(self._field_types_cache)
     
     def get_primary_keys(self) -> Optional[List[str]]:
         """
@@ -200,13 +226,18 @@ class ArrowSchema(Schema):
         Returns:
             List of primary key field names or None
         """
-        if self._arrow_schema.metadata:
-            primary_keys_bytes = self._arrow_schema.metadata.get(b'primary_keys')
-            if primary_keys_bytes:
-                # Decode and parse primary keys from metadata
-                primary_keys_str = primary_keys_bytes.decode('utf-8')
-                return primary_keys_str.split(',') if primary_keys_str else None
-        return None
+        if self._primary_keys_cache is _UNSET:
+            primary_keys = None
+            if self._arrow_schema.metadata:
+                primary_keys_bytes = self._arrow_schema.metadata.get(b'primary_keys')
+                if primary_keys_bytes:
+                    # Decode and parse primary keys from metadata
+                    primary_keys = primary_keys_bytes.decode('utf-8').split(',')
+            self._primary_keys_cache = primary_keys
+        # A copy, so callers cannot change the cached list
+        if self._primary_keys_cache is None:
+            return None
+        return list(self._primary_keys_cache)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -215,22 +246,23 @@ class ArrowSchema(Schema):
         Returns:
             Dictionary representation of the schema
         """
-        fields = []
-        for name, field in zip(self._arrow_schema.names, self._arrow_schema):
-            field_dict = {
-                'name': name,
+        fields = [
+            {
+                'name': field.name,
                 'type': str(field.type),
                 'nullable': field.nullable,
                 'metadata': dict(field.metadata) if field.metadata else {}
             }
-            fields.append(field_dict)
+            for field in self._arrow_schema
+        ]
+        schema_metadata = self._arrow_schema.metadata
         
         return {
-            'field_names': self.get_field_names(),
-            'field_count': len(self._arrow_schema),
+            'field_names': list(self._names),
+            'field_count': len(self._names),
             'fields': fields,
             'primary_key': self.get_primary_keys(),
-            'metadata': dict(self._arrow_schema.metadata) if self._arrow_schema.metadata else {}
+            'metadata': dict(schema_metadata) if schema_metadata else {}
         }
     
     def get_field_info(self, field_name: str) -> Dict[str, Any]:
@@ -244,44 +276,60 @@ class ArrowSchema(Schema):
             Dictionary containing field information
         """
         if field_name not in self._field_info_cache:
-            try:
-                field_index = self._arrow_schema.names.index(field_name)
-                field = self._arrow_schema.field(field_index)
-                
-                field_info = {
-                    'name': field.name,
-                    'type': str(field.type),
-                    'nullable': field.nullable,
-                    'metadata': dict(field.metadata) if field.metadata else {},
-                    'index': field_index
-                }
-                
-                # Add type-specific information safely
-                try:
-                    if hasattr(field.type, 'precision'):
-                        field_info['precision'] = field.type.precision
-                except (AttributeError, ValueError):
-                    pass
-                    
-                try:
-                    if hasattr(field.type, 'scale'):
-                        field_info['scale'] = field.type.scale
-                except (AttributeError, ValueError):
-                    pass
-                    
+            import pyarrow as pa
+            if self._name_to_index is None:
+                # Keep the first index of duplicate names, as names.index did
+                name_to_index = {}
+                for index, name in enumerate(self._names):
+                    name_to_index.setdefault(name, index)
+                self._name_to_index = name_to_index
+            field_index = self._name_to_index.get(field_name)
+            if field_index is None:
+                raise ValueError(f"Field '{field_name}' not found in schema")
+            
+            field = self._arrow_schema.field(field_index)
+            
+            field_info = {
+                'name': field.name,
+                'type': str(field.type),
+                'nullable': field.nullable,
+                'metadata': dict(field.metadata) if field.metadata else {},
+                'index': field_index
+            }
+            
+            # Add type-specific information, dispatching on the type id
+            # so that no attribute probing or exception handling is needed
+            field_type = field.type
+            if pa.types.is_decimal(field_type):
+                field_info['precision'] = field_type.precision
+                field_info['scale'] = field_type.scale
+                field_info['byte_width'] = field_type.byte_width
+            elif pa.types.is_fixed_size_binary(field_type) or (
+                    pa.types.is_primitive(field_type) and not pa.types.is_boolean(field_type)):
+                field_info['byte_width'] = field_type.byte_width
+            else:
+                # Other fixed-width types, such as dictionary-encoded ones
                 try:
-                    if hasattr(field.type, 'byte_width'):
-                        field_info['byte_width'] = field.type.byte_width
+                    field_info['byte_width'] = field_type.byte_width
                 except (AttributeError, ValueError):
                     pass
-                    
-                self._field_info_cache[field_name] = field_info
-                
-            except ValueError:
-                raise ValueError(f"Field '{field_name}' not found in schema")
                 
+            self._field_info_cache[field_name] = field_info
+            
         return self._field_info_cache[field_name]
     
+    def has_field(self, field_name: str) -> bool:
+        """
+        Check if the schema contains a specific field.
+        
+        Args:
+            field_name: Name of the field to check
+            
+        Returns:
+            True if field exists, False otherwise
+        """
+        return field_name in self._names_set
+    
     def validate(self) -> Dict[str, Any]:
         """
         Validate the schema and return validation results.
@@ -295,22 +343,24 @@ class ArrowSchema(Schema):
             'warnings': []
         }
         
-        # Check for duplicate field names
-        field_names = self.get_field_names()
-        if len(field_names) != len(set(field_names)):
+        # Check for duplicate field names, the cached set collapses duplicates
+        if len(self._names_set) != len(self._names):
             validation_result['valid'] = False
             validation_result['errors'].append("Schema contains duplicate field names")
         
         # Check for empty field names
-        if any(not name or not name.strip() for name in field_names):
+        if any(not name or not name.strip() for name in self._names_set):
             validation_result['valid'] = False
             validation_result['errors'].append("Schema contains empty field names")
         
         # Warn about complex types that might not be supported
-        complex_types = []
-        for name, field in zip(self._arrow_schema.names, self._arrow_schema):
-            if str(field.type).startswith(('list<', 'struct<', 'map<')):
-                complex_types.append(f"{name}: {field.type}")
+        import pyarrow as pa
+        is_list, is_struct, is_map = pa.types.is_list, pa.types.is_struct, pa.types.is_map
+        complex_types = [
+            f"{field.name}: {field.type}"
+            for field in self._arrow_schema
+            if is_list(field.type) or is_struct(field.type) or is_map(field.type)
+        ]
         
         if complex_types:
             validation_result['warnings'].append(
@@ -339,9 +389,8 @@ class ArrowSchema(Schema):
             New ArrowSchema instance with primary key metadata
         """
         # Validate that all primary key fields exist
-        field_names = self.get_field_names()
         for pk in primary_keys:
-            if pk not in field_names:
+            if pk not in self._names_set:
                 raise ValueError(f"Primary key field '{pk}' not found in schema")
         
         # Create new metadata with primary keys
@@ -363,20 +412,15 @@ class ArrowSchema(Schema):
             New ArrowSchema instance with selected fields
         """
         # Validate that all fields exist
-        schema_field_names = self.get_field_names()
         for field_name in field_names:
-            if field_name not in schema_field_names:
+            if field_name not in self._names_set:
                 raise ValueError(f"Field '{field_name}' not found in schema")
         
-        # Select fields by creating a new schema with only the specified fields
+        # Schema.field resolves names in C, avoiding a names.index scan per field
         import pyarrow as pa
-        selected_fields = []
-        for field_name in field_names:
-            field_index = self._arrow_schema.names.index(field_name)
-            selected_fields.append(self._arrow_schema.field(field_index))
-        
-        # Create new schema with selected fields
-        selected_schema = pa.schema(selected_fields, metadata=self._arrow_schema.metadata)
+        field = self._arrow_schema.field
+        selected_schema = pa.schema([field(name) for name in field_names],
+                                    metadata=self._arrow_schema.metadata)
         return ArrowSchema(selected_schema)
     
     def __str__(self) -> str:
@@ -412,31 +456,89 @@ def create_schema_from_dict(schema_dict: Dict[str, Any]) -> Schema:
     if 'fields' not in schema_dict:
         raise ValueError("Schema dictionary must contain 'fields' key")
     
-    fields = []
-    for field_info in schema_dict['fields']:
-        field_name = field_info['name']
-        field_type_str = field_info['type']
-        nullable = field_info.get('nullable', True)
-        metadata = field_info.get('metadata', {})
-        
-        # Convert string type to PyArrow type
-        try:
-            field_type = _string_to_arrow_type(field_type_str)
-        except Exception as e:
-            raise ValueError(f"Cannot convert type '{field_type_str}' for field '{field_name}': {e}")
-        
-        field = pa.field(field_name, field_type, nullable=nullable, metadata=metadata)
-        fields.append(field)
+    field = pa.field
+    fields = [
+        field(field_info['name'], _field_info_to_arrow_type(field_info),
+              nullable=field_info.get('nullable', True),
+              metadata=field_info.get('metadata') or None)
+        for field_info in schema_dict['fields']
+    ]
     
     # Create schema with metadata
-    schema_metadata = schema_dict.get('metadata', {})
-    if 'primary_key' in schema_dict and schema_dict['primary_key']:
-        schema_metadata[b'primary_keys'] = ','.join(schema_dict['primary_key']).encode('utf-8')
+    schema_metadata = schema_dict.get('metadata') or None
+    primary_key = schema_dict.get('primary_key')
+    if primary_key:
+        # Copy rather than update, the metadata dict belongs to the caller
+        schema_metadata = {**(schema_metadata or {}), b'primary_keys': _encode_primary_keys(tuple(primary_key))}
     
-    arrow_schema = pa.schema(fields, metadata=schema_metadata if schema_metadata else None)
+    arrow_schema = pa.schema(fields, metadata=schema_metadata)
     return ArrowSchema(arrow_schema)
 
 
+@functools.lru_cache(maxsize=256)
+def _encode_primary_keys(primary_keys: Tuple[str, ...]) -> bytes:
+    """
+    Encode primary key names into the schema metadata value.
+    
+    Args:
+        primary_keys: Primary key field names
+        
+    Returns:
+        Comma separated UTF-8 encoded primary keys
+    """
+    return ','.join(primary_keys).encode('utf-8')
+
+
+def _field_info_to_arrow_type(field_info: Dict[str, Any]):
+    """
+    Convert the type of a field dictionary to a PyArrow type.
+    
+    Args:
+        field_info: Dictionary containing 'name' and 'type' of a field
+        
+    Returns:
+        PyArrow data type
+    """
+    field_type_str = field_info['type']
+    try:
+        return _string_to_arrow_type(field_type_str)
+    except Exception as e:
+        raise ValueError(f"Cannot convert type '{field_type_str}' for field '{field_info['name']}': {e}")
+
+
+def _get_type_mapping() -> Dict[str, Any]:
+    """
+    Get the basic type name to PyArrow type mapping, building it on first use.
+    
+    Returns:
+        Dictionary of type name to PyArrow data type
+    """
+    global _TYPE_MAPPING
+    if _TYPE_MAPPING is None:
+        import pyarrow as pa
+        _TYPE_MAPPING = {
+            'bool': pa.bool_(),
+            'int8': pa.int8(),
+            'int16': pa.int16(),
+            'int32': pa.int32(),
+            'int64': pa.int64(),
+            'uint8': pa.uint8(),
+            'uint16': pa.uint16(),
+            'uint32': pa.uint32(),
+            'uint64': pa.uint64(),
+            'float': pa.float32(),
+            'float32': pa.float32(),
+            'float64': pa.float64(),
+            'double': pa.float64(),
+            'string': pa.string(),
+            'binary': pa.binary(),
+            'date32': pa.date32(),
+            'date64': pa.date64(),
+            'timestamp': pa.timestamp('us'),
+        }
+    return _TYPE_MAPPING
+
+
 def _string_to_arrow_type(type_str: str):
     """
     Convert string type representation to PyArrow type.
@@ -449,37 +551,15 @@ def _string_to_arrow_type(type_str: str):
     """
     import pyarrow as pa
     
-    # Basic type mappings
-    type_mapping = {
-        'bool': pa.bool_(),
-        'int8': pa.int8(),
-        'int16': pa.int16(),
-        'int32': pa.int32(),
-        'int64': pa.int64(),
-        'uint8': pa.uint8(),
-        'uint16': pa.uint16(),
-        'uint32': pa.uint32(),
-        'uint64': pa.uint64(),
-        'float': pa.float32(),
-        'float32': pa.float32(),
-        'float64': pa.float64(),
-        'double': pa.float64(),
-        'string': pa.string(),
-        'binary': pa.binary(),
-        'date32': pa.date32(),
-        'date64': pa.date64(),
-        'timestamp': pa.timestamp('us'),
-    }
-    
     # Check for exact match first
-    if type_str in type_mapping:
-        return type_mapping[type_str]
+    data_type = _get_type_mapping().get(type_str)
+    if data_type is not None:
+        return data_type
     
     # Handle parameterized types
     if type_str.startswith('decimal'):
         # Extract precision and scale from decimal(precision, scale)
-        import re
-        match = re.match(r'decimal\((\d+),?\s*(\d+)?\)', type_str)
+        match = _DECIMAL_RE.match(type_str)
         if match:
             precision = int(match.group(1))
             scale = int(match.group(2)) if match.group(2) else 0
@@ -487,8 +567,7 @@ def _string_to_arrow_type(type_str: str):
     
     elif type_str.startswith('timestamp'):
         # Handle timestamp with timezone
-        import re
-        match = re.match(r'timestamp\[(.+)\]', type_str)
+        match = _TS_RE.match(type_str)
         if match:
             unit = match.group(1)
             return pa.timestamp(unit)
@@ -499,8 +578,17 @@ def _string_to_arrow_type(type_str: str):
         inner_type = _string_to_arrow_type(inner_type_str)
         return pa.list_(inner_type)
     
-    # If no match found, try to parse it directly with PyArrow
-    try:
-        return eval(f"pa.{type_str}()")
-    except:
-        raise ValueError(f"Unknown type: {type_str}")
+    # If no match found, fall back to a no-argument PyArrow type factory.
+    # Only public pyarrow.lib callables are tried so that arbitrary helpers
+    # such as pa.show_versions are never invoked.
+    factory = None
+    if type_str.isidentifier() and not type_str.startswith('_'):
+        factory = getattr(pa, type_str, None)
+    if callable(factory) and getattr(factory, '__module__', None) == 'pyarrow.lib':
+        try:
+            data_type = factory()
+        except Exception:
+            data_type = None
+        if isinstance(data_type, pa.DataType):
+            return data_type
+    raise ValueError(f"Unknown type: {type_str}")
@@ -28,6 +28,8 @@ class TableScan(ABC):
     Abstract base class for table scan operations.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def plan(self) -> 'Plan':
         """
@@ -44,6 +46,8 @@ class Plan(ABC):
     Abstract base class for execution plan in Fluss.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def table_buckets(self) -> List[Dict[str, Any]]:
         """
@@ -16,8 +16,20 @@
 # limitations under the License.
 ################################################################################
 
+import threading
 from abc import ABC, abstractmethod
-from typing import List, TYPE_CHECKING, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, TYPE_CHECKING, Any
+
+# Default thresholds at which buffered record batches are handed over
+DEFAULT_FLUSH_BYTES = 1024 * 1024
+DEFAULT_MAX_BATCHES = 64
+
+# Assumed size of a variable-width value when estimating row sizes
+_VARIABLE_WIDTH_BYTES = 32
+
+# Size of the Arrow IPC end-of-stream marker (continuation token + zero length)
+_IPC_EOS_BYTES = 8
 
 if TYPE_CHECKING:
     try:
@@ -60,15 +72,57 @@ class BatchTableWrite(TableWrite):
         """
         pass
 
-    @abstractmethod
+    def write_arrow_batch_async(self, record_batch: Any) -> Future:
+        """
+        Write an Arrow record batch without waiting for the transfer.
+        
+        Record batches are immutable, so the caller may keep using the batch
+        while it is being written. The default writes synchronously and
+        returns a completed future.
+        
+        Args:
+            record_batch: PyArrow RecordBatch to write
+            
+        Returns:
+            Future that completes when the batch has been handed to the writer
+        """
+        future = Future()
+        try:
+            self.write_arrow_batch(record_batch)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+        return future
+
+    def write_arrow_ipc_stream(self, buf: Any):
+        """
+        Write record batches that are already serialized as an Arrow IPC stream.
+        
+        The default decodes the stream and delegates to write_arrow;
+        implementations that transfer IPC bytes forward them unchanged.
+        
+        Args:
+            buf: Bytes-like object holding a complete Arrow IPC stream
+        """
+        import pyarrow as pa
+        
+        self.write_arrow(pa.ipc.open_stream(buf).read_all())
+
     def write_pandas(self, dataframe: Any):
         """
         Write a Pandas DataFrame.
         
+        The default converts the DataFrame to an Arrow table column by column
+        (numeric columns without nulls are wrapped without copying) and
+        delegates to write_arrow.
+        
         Args:
             dataframe: Pandas DataFrame to write
         """
-        pass
+        import pyarrow as pa
+        
+        self.write_arrow(pa.Table.from_pandas(dataframe, preserve_index=False))
 
     @abstractmethod
     def close(self):
@@ -76,3 +130,206 @@ class BatchTableWrite(TableWrite):
         Close the write operation.
         """
         pass
+
+
+class BufferedBatchTableWrite(BatchTableWrite):
+    """
+    Batch table write that coalesces record batches before handing them over.
+    
+    Record batches passed to write_arrow_batch are buffered and serialized
+    into a single Arrow IPC stream per flush, so many small batches cost one
+    transfer to the underlying writer instead of one each. Subclasses deliver
+    the serialized stream by implementing _write_ipc_stream.
+    """
+
+    def __init__(self, flush_bytes: int = DEFAULT_FLUSH_BYTES,
+                 max_batches: int = DEFAULT_MAX_BATCHES,
+                 batch_rows: Optional[int] = None):
+        """
+        Initialize the buffer.
+        
+        Args:
+            flush_bytes: Buffered batch size in bytes that triggers a flush
+            max_batches: Number of buffered batches that triggers a flush
+            batch_rows: Maximum rows per record batch when splitting tables in
+                write_arrow, or None to size batches to about flush_bytes
+        """
+        self._flush_bytes = flush_bytes
+        self._max_batches = max_batches
+        self._batch_rows = batch_rows
+        self._pending: List[Any] = []
+        self._pending_bytes = 0
+        # Staging buffer reused across flushes, since the serialized bytes are
+        # copied out before the next flush
+        self._ipc_buffer = None
+        # Guards the buffer against the async write worker
+        self._lock = threading.RLock()
+        self._async_executor: Optional[ThreadPoolExecutor] = None
+
+    def write_arrow(self, table: Any):
+        """
+        Write an Arrow table as a sequence of bounded record batches.
+        
+        Splitting keeps peak memory on both sides of the bridge proportional to
+        the batch size rather than the table size. Small chunks within a slice
+        are merged, so a table built from many tiny batches still goes over as
+        a few large IPC messages.
+        
+        Args:
+            table: PyArrow Table to write
+        """
+        batch_rows = self._batch_rows
+        if batch_rows is None:
+            batch_rows = max(1, self._flush_bytes // _estimate_row_bytes(table.schema))
+        for offset in range(0, table.num_rows, batch_rows):
+            # combine_chunks does not copy a slice that lies in a single chunk
+            for record_batch in table.slice(offset, batch_rows).combine_chunks().to_batches():
+                self.write_arrow_batch(record_batch)
+
+    def write_arrow_batch(self, record_batch: Any):
+        """
+        Buffer an Arrow record batch, flushing once a threshold is reached.
+        
+        Args:
+            record_batch: PyArrow RecordBatch to write
+        """
+        if record_batch.num_rows == 0:
+            return
+        with self._lock:
+            # One IPC stream carries a single schema
+            if self._pending and not record_batch.schema.equals(self._pending[0].schema):
+                self.flush()
+            self._pending.append(record_batch)
+            self._pending_bytes += record_batch.nbytes
+            if self._pending_bytes >= self._flush_bytes or len(self._pending) >= self._max_batches:
+                self.flush()
+
+    def write_arrow_batch_async(self, record_batch: Any) -> Future:
+        """
+        Write an Arrow record batch on a background worker.
+        
+        Serialization and transfer run on a single worker thread, so batches
+        are written in submission order while the caller prepares the next
+        batch. close() waits for all submitted batches.
+        
+        Args:
+            record_batch: PyArrow RecordBatch to write
+            
+        Returns:
+            Future that completes when the batch has been buffered or written
+        """
+        with self._lock:
+            if self._async_executor is None:
+                self._async_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='pyfluss-write')
+            return self._async_executor.submit(self.write_arrow_batch, record_batch)
+
+    def flush(self):
+        """
+        Serialize the buffered record batches and hand them to the writer.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            batches = self._pending
+            self._pending = []
+            self._pending_bytes = 0
+            if self._ipc_buffer is None:
+                import pyarrow as pa
+                self._ipc_buffer = pa.allocate_buffer(self._flush_bytes, resizable=True)
+            self._write_ipc_stream(_serialize_batches(batches, self._ipc_buffer))
+
+    def write_arrow_ipc_stream(self, buf: Any):
+        """
+        Forward an Arrow IPC stream to the writer without decoding it.
+        
+        Args:
+            buf: Bytes-like object holding a complete Arrow IPC stream
+        """
+        with self._lock:
+            # Keep ordering with batches buffered before this stream
+            self.flush()
+            self._write_ipc_stream(buf if isinstance(buf, bytes) else bytes(buf))
+
+    @abstractmethod
+    def _write_ipc_stream(self, ipc_bytes: bytes):
+        """
+        Write serialized Arrow IPC stream bytes to the underlying writer.
+        
+        Args:
+            ipc_bytes: Arrow IPC stream containing one or more record batches
+        """
+        pass
+
+    def close(self):
+        """
+        Wait for pending async writes and flush buffered record batches.
+        """
+        if self._async_executor is not None:
+            self._async_executor.shutdown(wait=True)
+            self._async_executor = None
+        self.flush()
+
+
+def _serialize_batches(batches: List[Any], scratch: Any = None) -> bytes:
+    """
+    Serialize record batches sharing one schema into an Arrow IPC stream.
+    
+    Args:
+        batches: Non-empty list of PyArrow RecordBatches
+        scratch: Optional resizable buffer to serialize into, grown as needed
+            and reusable once this call returns
+        
+    Returns:
+        Arrow IPC stream bytes
+    """
+    import pyarrow as pa
+    
+    schema = batches[0].schema
+    # The stream is the schema message, one message per batch and the
+    # end-of-stream marker, so the exact size is known up front and the
+    # buffer never has to grow while writing
+    capacity = schema.serialize().size + _IPC_EOS_BYTES
+    for batch in batches:
+        capacity += pa.ipc.get_record_batch_size(batch)
+    if scratch is None:
+        buffer = pa.allocate_buffer(capacity)
+    else:
+        if scratch.size < capacity:
+            scratch.resize(capacity)
+        buffer = scratch
+    try:
+        sink = pa.FixedSizeBufferWriter(buffer)
+        with pa.ipc.new_stream(sink, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+        return buffer.slice(0, sink.tell()).to_pybytes()
+    except (OSError, pa.ArrowException):
+        # Streams with extra messages (e.g. dictionaries) outgrow the buffer
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+        return sink.getvalue().to_pybytes()
+
+
+def _estimate_row_bytes(schema: Any) -> int:
+    """
+    Estimate the in-memory size of one row of an Arrow schema.
+    
+    Args:
+        schema: PyArrow Schema
+        
+    Returns:
+        Estimated row size in bytes, at least 1
+    """
+    import pyarrow as pa
+    
+    bits = 0
+    for data_type in schema.types:
+        if (pa.types.is_primitive(data_type) or pa.types.is_decimal(data_type)
+                or pa.types.is_fixed_size_binary(data_type)):
+            bits += data_type.bit_width
+        else:
+            bits += _VARIABLE_WIDTH_BYTES * 8
+    return max(1, bits // 8)
@@ -24,16 +24,25 @@ This module provides a command-line interface for common Pyfluss operations.
 """
 
 import argparse
+import functools
 import sys
 import os
-from typing import Optional
+from typing import Optional, Tuple
+
+
+@functools.lru_cache(maxsize=1)
+def _list_jars(jar_dir: str) -> Tuple[str, ...]:
+    """List the JAR file names in a directory, reusing the last listing."""
+    with os.scandir(jar_dir) as entries:
+        return tuple(entry.name for entry in entries if entry.name.endswith('.jar'))
 
 
 def cmd_version() -> None:
     """Print version information."""
     try:
-        import pyfluss
-        print(f"Pyfluss version: {pyfluss.__version__}")
+        # Only the version constant is needed, skip the low-level API imports
+        from pyfluss.version import __version__
+        print(f"Pyfluss version: {__version__}")
         print(f"Python version: {sys.version}")
     except ImportError as e:
         print(f"Error importing pyfluss: {e}", file=sys.stderr)
@@ -52,7 +61,7 @@ def cmd_info() -> None:
         print(f"JAR directory: {jar_dir}")
         
         if os.path.exists(jar_dir):
-            jar_files = [f for f in os.listdir(jar_dir) if f.endswith('.jar')]
+            jar_files = list(_list_jars(jar_dir))
             print(f"JAR files: {jar_files}")
         else:
             print("JAR directory not found!")
@@ -85,11 +94,13 @@ def cmd_validate() -> None:
             'TableScan', 'Plan', 'RowType'
         ]
         
+        # dir() lists the lazy exports whether or not they load, so resolve each one
         missing_classes = []
         for cls_name in core_classes:
-            if hasattr(pyfluss, cls_name):
+            try:
+                getattr(pyfluss, cls_name)
                 print(f"✓ {cls_name} accessible")
-            else:
+            except (ImportError, AttributeError):
                 missing_classes.append(cls_name)
                 print(f"✗ {cls_name} not accessible")
         
@@ -98,7 +109,7 @@ def cmd_validate() -> None:
         jar_dir = os.path.join(package_dir, 'jars')
         
         if os.path.exists(jar_dir):
-            jar_files = [f for f in os.listdir(jar_dir) if f.endswith('.jar')]
+            jar_files = list(_list_jars(jar_dir))
             if jar_files:
                 print(f"✓ JAR files found: {jar_files}")
             else:
@@ -117,13 +128,12 @@ def cmd_validate() -> None:
         sys.exit(1)
 
 
-def cmd_example() -> None:
-    """Show usage examples."""
-    print("Pyfluss Usage Examples:")
-    print("=" * 50)
-    
-    print("\n1. Basic catalog operations:")
-    print("""
+_EXAMPLE_TEXT = """\
+Pyfluss Usage Examples:
+==================================================
+
+1. Basic catalog operations:
+
 import pyfluss
 
 # Create a catalog
@@ -139,10 +149,10 @@ print(f"Databases: {databases}")
 
 # Get a table
 table = catalog.get_table('my_database.my_table')
-""")
 
-    print("\n2. Reading data:")
-    print("""
+
+2. Reading data:
+
 # Create a read builder
 read_builder = table.new_read_builder()
 
@@ -156,10 +166,10 @@ plan = scan.plan()
 for table_bucket in plan.table_buckets():
     reader = read_builder.new_read().create_reader(table_bucket)
     # Process data...
-""")
 
-    print("\n3. Writing data:")
-    print("""
+
+3. Writing data:
+
 # Create a write builder and writer
 write_builder = table.new_write_builder()
 write = write_builder.new_write()
@@ -170,7 +180,13 @@ for record in data:
 
 # Close writer (data is automatically committed)
 write.close()
-""")
+
+"""
+
+
+def cmd_example() -> None:
+    """Show usage examples."""
+    sys.stdout.write(_EXAMPLE_TEXT)
 
 
 def main() -> None:
@@ -183,29 +199,19 @@ def main() -> None:
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # Version command
-    subparsers.add_parser('version', help='Show version information')
+    subparsers.add_parser('version', help='Show version information').set_defaults(func=cmd_version)
     
     # Info command
-    subparsers.add_parser('info', help='Show package information')
+    subparsers.add_parser('info', help='Show package information').set_defaults(func=cmd_info)
     
     # Validate command
-    subparsers.add_parser('validate', help='Validate package installation')
+    subparsers.add_parser('validate', help='Validate package installation').set_defaults(func=cmd_validate)
     
     # Example command
-    subparsers.add_parser('example', help='Show usage examples')
+    subparsers.add_parser('example', help='Show usage examples').set_defaults(func=cmd_example)
     
     args = parser.parse_args()
-    
-    if args.command == 'version':
-        cmd_version()
-    elif args.command == 'info':
-        cmd_info()
-    elif args.command == 'validate':
-        cmd_validate()
-    elif args.command == 'example':
-        cmd_example()
-    else:
-        parser.print_help()
+    getattr(args, 'func', parser.print_help)()
 
 
 if __name__ == '__main__':
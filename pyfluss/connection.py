@@ -17,18 +17,100 @@
 ################################################################################
 
 import os
+import re
+import functools
 import logging
 import atexit
-import subprocess
+import threading
 import time
-from typing import Optional, Dict, Any, List, Union, TYPE_CHECKING
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Union, TYPE_CHECKING
+
+from .api.admin import Admin
+from .api.metadata import DatabaseDescriptor
+from .api.schema import Schema
+from .reader import FlussDataReader
+from .writer import FlussDataWriter
 
 if TYPE_CHECKING:
     from pyfluss.api.table import Table
-    from pyfluss.api.schema import Schema
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of admin operations in flight for async_=True calls
+_ASYNC_MAX_WORKERS = 8
+
+# Number of Java connections create_writer/create_reader spread threads over
+_CONNECTION_POOL_SIZE_ENV = 'FLUSS_CONN_POOL_SIZE'
+
+# Must match org.example.FlussPy4JUtils.SEPARATOR
+_ENTRY_SEPARATOR = '\x00'
+
+# Upper-cased column type name -> DataTypes factory method name
+_FLUSS_TYPE_FACTORIES = {
+    'STRING': 'STRING',
+    'VARCHAR': 'STRING',
+    'INT64': 'BIGINT',
+    'BIGINT': 'BIGINT',
+    'LONG': 'BIGINT',
+    'INT32': 'INT',
+    'INT': 'INT',
+    'INTEGER': 'INT',
+    'FLOAT64': 'DOUBLE',
+    'DOUBLE': 'DOUBLE',
+    'FLOAT': 'DOUBLE',
+    'FLOAT32': 'FLOAT',
+    'BOOL': 'BOOLEAN',
+    'BOOLEAN': 'BOOLEAN',
+}
+
+_DECIMAL_RE = re.compile(r'DECIMAL\((\d+),?\s*(\d+)?\)')
+
+# Java exception classes worth retrying; anything else (e.g. an
+# "already exists" error) fails on the first attempt
+_RETRYABLE_JAVA_EXCEPTIONS = frozenset([
+    'java.util.concurrent.TimeoutException',
+    'java.io.IOException',
+    'java.net.ConnectException',
+    'java.net.SocketTimeoutException',
+])
+
+
+class _RetryableOperationError(RuntimeError):
+    """Async operation failure caused by a transient Java exception."""
+
+
+def _java_exception_class_name(java_exception) -> str:
+    """Get the class name of a Java exception, unwrapping ExecutionException."""
+    name = java_exception.getClass().getName()
+    if name == 'java.util.concurrent.ExecutionException':
+        cause = java_exception.getCause()
+        if cause is not None:
+            name = cause.getClass().getName()
+    return name
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_table_path(table_path: str) -> Tuple[str, str]:
+    """
+    Split a 'database.table' or 'catalog.database.table' path.
+    
+    Args:
+        table_path: Full table path
+        
+    Returns:
+        Tuple of (database_name, table_name)
+    """
+    parts = table_path.split('.')
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    elif len(parts) == 3:
+        # catalog.database.table format
+        return parts[1], parts[2]
+    raise ValueError(f"Invalid table path format: {table_path}. Expected 'database.table' or 'catalog.database.table'")
+
+
 class FlussConnection:
     """
     PyFluss connection manager that automatically handles Java gateway lifecycle.
@@ -37,19 +119,37 @@ class FlussConnection:
     managing the underlying Java gateway connection transparently.
     """
     
-    def __init__(self, server_address: str = "localhost:9123"):
+    def __init__(self, server_address: str = "localhost:9123", max_retries: int = 3,
+                 timeout: int = 30, retryable_exceptions: Optional[List[str]] = None):
         """
         Initialize a Fluss connection.
         
         Args:
             server_address: Fluss server address in format "host:port"
+            max_retries: Attempts per admin operation when it fails transiently
+            timeout: Timeout per admin operation attempt in seconds
+            retryable_exceptions: Extra Java exception class names to retry on
         """
         self.server_address = server_address
+        self._max_retries = max_retries
+        self._timeout = timeout
+        self._retryable_exceptions = _RETRYABLE_JAVA_EXCEPTIONS.union(retryable_exceptions or ())
         self._gateway = None
         self._java_process = None     # Process for Java gateway server
         self._java_app = None         # Main Java application entry point
         self._java_connection = None  # 缓存Java连接对象，这是主要的API入口
+        self._admin = None            # Java Admin from the cached connection
+        self._reader_factory = None   # Shared FlussDataReaderFactory for create_reader
+        self._connection_pool_size = int(os.environ.get(_CONNECTION_POOL_SIZE_ENV, '1'))
+        self._java_connection_pool = None        # Java FlussConnectionPool, when size > 1
+        self._java_connection_pool_lock = threading.Lock()
+        self._thread_connections = threading.local()  # Pool connection bound per thread
+        self._data_type_factories = {}  # DataTypes factory name -> Py4J method handle
+        self._data_types_by_name = {}   # Column type string -> Fluss DataType
         self._is_connected = False
+        self._async_executor = None   # Runs admin operations submitted with async_=True
+        self._async_executor_lock = threading.Lock()
+        self._close_lock = threading.Lock()
         
     def __enter__(self):
         """Context manager entry - establish connection."""
@@ -75,18 +175,19 @@ class FlussConnection:
             # Get JAR path
             jar_path = self._get_jar_path()
             
-            # Start Java gateway server process
-            self._start_java_gateway_server(jar_path)
-            
-            # Wait a moment for server to start
-            time.sleep(2)
+            # Start Java gateway server process, returns once it is listening
+            port = self._start_java_gateway_server(jar_path)
             
-            # Create Java gateway client
-            import py4j.java_gateway
-            self._gateway = py4j.java_gateway.JavaGateway()
+            # Create Java gateway client. JavaGateway keeps a shared pool of
+            # sockets that any Python thread can reuse; pinned-thread
+            # ClientServer would need a ClientServer JVM, not the
+            # py4j.GatewayServer that launch_gateway starts.
+            from py4j.java_gateway import JavaGateway, GatewayParameters
+            self._gateway = JavaGateway(
+                gateway_parameters=GatewayParameters(port=port, auto_convert=True))
             
-            # Get the main Java application entry point
-            self._java_app = self._gateway.entry_point
+            # The launched server has no entry point, create the Fluss gateway directly
+            self._java_app = self._gateway.jvm.org.example.FlussGateway()
             
             # 创建并缓存Java连接对象
             self._java_connection = self._java_app.createConnection(self.server_address)
@@ -97,7 +198,8 @@ class FlussConnection:
             self._is_connected = True
             logger.info(f"Successfully connected to Fluss at {self.server_address}")
             
-            # Register cleanup on exit
+            # Register cleanup on exit; close() unregisters it again, so
+            # reconnecting never stacks up handlers
             atexit.register(self.close)
             
         except Exception as e:
@@ -109,10 +211,30 @@ class FlussConnection:
         
     def close(self):
         """Close the connection and cleanup resources."""
-        if not self._is_connected:
-            return
+        with self._close_lock:
+            if not self._is_connected:
+                return
+            self._is_connected = False
+        atexit.unregister(self.close)
             
         try:
+            # Let in-flight async admin operations finish while the admin,
+            # connections and gateway they use are still open
+            if self._async_executor is not None:
+                self._async_executor.shutdown(wait=True)
+                self._async_executor = None
+                
+            # The admin belongs to the Java connection, drop it first
+            self._admin = None
+            
+            if self._java_connection_pool is not None:
+                try:
+                    self._java_connection_pool.close()
+                except:
+                    pass
+                self._java_connection_pool = None
+                self._thread_connections = threading.local()
+                
             # 清理Java连接对象
             if self._java_connection:
                 try:
@@ -132,7 +254,9 @@ class FlussConnection:
                 self._java_process = None
                 
             self._java_app = None
-            self._is_connected = False
+            self._reader_factory = None
+            self._data_type_factories.clear()
+            self._data_types_by_name.clear()
             logger.info("Fluss connection closed")
             
         except Exception as e:
@@ -152,8 +276,7 @@ class FlussConnection:
         Returns:
             Admin instance for catalog operations
         """
-        connection = self._get_connection()
-        return connection.getAdmin()  # Return admin for catalog operations
+        return self._get_admin()  # Return admin for catalog operations
         
     def create_writer(self, table_path: str):
         """
@@ -167,21 +290,11 @@ class FlussConnection:
         """
         self._ensure_connected()
         
-        # Parse table path
-        parts = table_path.split('.')
-        if len(parts) == 2:
-            database_name, table_name = parts
-        elif len(parts) == 3:
-            # catalog.database.table format
-            _, database_name, table_name = parts
-        else:
-            raise ValueError(f"Invalid table path format: {table_path}. Expected 'database.table' or 'catalog.database.table'")
+        database_name, table_name = _parse_table_path(table_path)
         
-        # 使用缓存的连接
-        connection = self._get_connection()
-        table = connection.getTable(database_name, table_name)
-        java_writer = self._java_app.createDataWriter(table)
-        from .writer import FlussDataWriter
+        # The Java connection keeps one writer per table, so repeated calls
+        # skip getTable and the writer set-up
+        java_writer = self._checkout_connection().getDataWriter(database_name, table_name)
         return FlussDataWriter(java_writer, self._gateway)
         
     def create_reader(self, table_path: str, **kwargs):
@@ -197,24 +310,13 @@ class FlussConnection:
         """
         self._ensure_connected()
         
-        # Parse table path
-        parts = table_path.split('.')
-        if len(parts) == 2:
-            database_name, table_name = parts
-        elif len(parts) == 3:
-            # catalog.database.table format
-            _, database_name, table_name = parts
-        else:
-            raise ValueError(f"Invalid table path format: {table_path}. Expected 'database.table' or 'catalog.database.table'")
+        database_name, table_name = _parse_table_path(table_path)
         
-        # 使用缓存的连接
-        connection = self._get_connection()
+        connection = self._checkout_connection()
         table = connection.getTable(database_name, table_name)
         
-        reader_factory = self._gateway.jvm.org.example.FlussDataReaderFactory()
-        java_reader = reader_factory.createScanReader(table, "snapshot")
+        java_reader = self._get_reader_factory().createScanReader(table, "snapshot")
             
-        from .reader import FlussDataReader
         return FlussDataReader(java_reader, self._gateway)
         
     def execute_sql(self, sql: str):
@@ -233,7 +335,7 @@ class FlussConnection:
         
     def create_database(self, database_name: str, database_descriptor=None, 
                         if_not_exists: bool = True, comment: str = None, 
-                        custom_properties: Dict[str, str] = None):
+                        custom_properties: Dict[str, str] = None, async_: bool = False):
         """
         Create a database.
         
@@ -243,27 +345,28 @@ class FlussConnection:
             if_not_exists: Whether to ignore if database already exists (used when database_descriptor is None)
             comment: Database comment (used when database_descriptor is None)
             custom_properties: Custom properties (used when database_descriptor is None)
+            async_: Return a Future instead of waiting for the operation
             
         Returns:
-            True if successful
+            True if successful, or a Future resolving to the result if async_ is set
         """
         self._ensure_connected()
+        if async_:
+            return self._submit_async(functools.partial(
+                self.create_database, database_name, database_descriptor,
+                if_not_exists, comment, custom_properties))
         
         try:
-            # 使用缓存的连接获取admin
-            connection = self._get_connection()
-            admin = connection.getAdmin()
+            admin = self._get_admin()
             
             # Handle DatabaseDescriptor or create one from parameters
             if database_descriptor is not None:
                 # Use provided DatabaseDescriptor
-                from pyfluss.api.metadata import DatabaseDescriptor
                 if not isinstance(database_descriptor, DatabaseDescriptor):
                     raise ValueError("database_descriptor must be a DatabaseDescriptor instance")
                 desc = database_descriptor
             else:
                 # Create DatabaseDescriptor from parameters (backward compatibility)
-                from pyfluss.api.metadata import DatabaseDescriptor
                 builder = DatabaseDescriptor.builder()
                 if comment:
                     builder = builder.comment(comment)
@@ -272,7 +375,7 @@ class FlussConnection:
                 desc = builder.build()
             
             # Create Java DatabaseDescriptor using builder pattern
-            java_builder = self._gateway.jvm.com.alibaba.fluss.metadata.DatabaseDescriptor.builder()
+            java_builder = self._jvm_classes().DatabaseDescriptor.builder()
             
             if desc.comment:
                 java_builder = java_builder.comment(desc.comment)
@@ -280,10 +383,10 @@ class FlussConnection:
             # Set custom properties if provided
             if desc.custom_properties:
                 try:
-                    # Create a Java HashMap for custom properties
-                    java_map = self._gateway.jvm.java.util.HashMap()
-                    for key, value in desc.custom_properties.items():
-                        java_map.put(key, value)
+                    # Ship the whole map in a single call rather than one put() per entry
+                    encoded = _ENTRY_SEPARATOR.join(
+                        str(item) for entry in desc.custom_properties.items() for item in entry)
+                    java_map = self._jvm_classes().FlussPy4JUtils.buildStringMap(encoded)
                     
                     # Use the customProperties method that accepts Map<String, String>
                     java_builder = java_builder.customProperties(java_map)
@@ -308,7 +411,8 @@ class FlussConnection:
             
     def create_table(self, database_name: str, table_name: str, 
                      schema_or_columns: Union['Schema', List[Dict[str, str]]], 
-                     primary_keys: List[str] = None, if_not_exists: bool = True):
+                     primary_keys: List[str] = None, if_not_exists: bool = True,
+                     async_: bool = False):
         """
         Create a table with the specified schema.
         
@@ -318,19 +422,21 @@ class FlussConnection:
             schema_or_columns: Either a Schema object or list of column definitions (each dict should have 'name' and 'type')
             primary_keys: List of primary key column names (only used if schema_or_columns is a list)
             if_not_exists: Whether to ignore if table already exists
+            async_: Return a Future instead of waiting for the operation
             
         Returns:
-            True if successful
+            True if successful, or a Future resolving to the result if async_ is set
         """
         self._ensure_connected()
+        if async_:
+            return self._submit_async(functools.partial(
+                self.create_table, database_name, table_name, schema_or_columns,
+                primary_keys, if_not_exists))
         
         try:
-            # 使用缓存的连接获取admin
-            connection = self._get_connection()
-            admin = connection.getAdmin()
+            admin = self._get_admin()
             
             # Handle different input types
-            from pyfluss.api.schema import Schema
             if isinstance(schema_or_columns, Schema):
                 # Use Schema object
                 schema_columns = []
@@ -346,12 +452,12 @@ class FlussConnection:
                 schema_columns = schema_or_columns
             
             # Build schema
-            schema_builder = self._gateway.jvm.com.alibaba.fluss.metadata.Schema.newBuilder()
+            schema_builder = self._jvm_classes().Schema.newBuilder()
             
             # Add columns
             for col in schema_columns:
                 col_name = col['name']
-                col_type = col['type'].upper()
+                col_type = col['type']
                 
                 # Map Python type names to Fluss DataTypes
                 data_type = self._map_type_to_fluss_datatype(col_type)
@@ -359,18 +465,18 @@ class FlussConnection:
             
             # Set primary keys if specified
             if primary_keys:
-                pk_array = self._gateway.new_array(self._gateway.jvm.java.lang.String, len(primary_keys))
-                for i, pk in enumerate(primary_keys):
-                    pk_array[i] = pk
+                # One call builds the String[] instead of one per element
+                pk_array = self._jvm_classes().FlussPy4JUtils.buildStringArray(
+                    _ENTRY_SEPARATOR.join(primary_keys))
                 schema_builder.primaryKey(pk_array)
             
             schema = schema_builder.build()
             
             # Create table descriptor
-            table_descriptor = self._gateway.jvm.com.alibaba.fluss.metadata.TableDescriptor.builder().schema(schema).build()
+            table_descriptor = self._jvm_classes().TableDescriptor.builder().schema(schema).build()
             
             # Create table
-            table_path = self._gateway.jvm.com.alibaba.fluss.metadata.TablePath.of(database_name, table_name)
+            table_path = self._jvm_classes().TablePath.of(database_name, table_name)
             
             def create_operation():
                 return admin.createTable(table_path, table_descriptor, if_not_exists)
@@ -394,28 +500,8 @@ class FlussConnection:
         self._ensure_connected()
         
         try:
-            # 使用缓存的连接获取admin
-            connection = self._get_connection()
-            admin = connection.getAdmin()
-            
-            def list_operation():
-                return admin.listDatabases()
-            
-            databases = self._handle_async_operation_with_retry(list_operation)
-            # Convert Java collection to Python list - use iterator approach
-            result = []
-            try:
-                iterator = databases.iterator()
-                while iterator.hasNext():
-                    result.append(str(iterator.next()))
-            except:
-                # Fallback: assume it's already a list-like
-                try:
-                    result = [str(db) for db in databases]
-                except:
-                    logger.warning("Could not iterate over databases")
-                    result = []
-            return result
+            # Admin converts the Java collection in a single Py4J call
+            return self.getAdmin().list_databases()
         except Exception as e:
             logger.error(f"Failed to list databases: {e}")
             return []
@@ -433,39 +519,19 @@ class FlussConnection:
         self._ensure_connected()
         
         try:
-            # 使用缓存的连接获取admin
-            connection = self._get_connection()
-            admin = connection.getAdmin()
-            
-            def list_operation():
-                return admin.listTables(database_name)
-            
-            tables = self._handle_async_operation_with_retry(list_operation)
-            # Convert Java collection to Python list - use iterator approach
-            result = []
-            try:
-                iterator = tables.iterator()
-                while iterator.hasNext():
-                    result.append(str(iterator.next()))
-            except:
-                # Fallback: assume it's already a list-like
-                try:
-                    result = [str(table) for table in tables]
-                except:
-                    logger.warning(f"Could not iterate over tables in database {database_name}")
-                    result = []
-            return result
+            # Admin converts the Java collection in a single Py4J call
+            return self.getAdmin().list_tables(database_name)
         except Exception as e:
             logger.error(f"Failed to list tables in database {database_name}: {e}")
             return []
 
-    def _handle_async_operation(self, future_result, timeout: int = 30):
+    def _handle_async_operation(self, future_result, timeout: Optional[int] = None):
         """
         Handle Java CompletableFuture operations synchronously.
         
         Args:
             future_result: Java CompletableFuture object
-            timeout: Timeout in seconds
+            timeout: Timeout in seconds, defaults to the connection's timeout
             
         Returns:
             The result of the async operation
@@ -474,44 +540,56 @@ class FlussConnection:
             TimeoutError: If operation times out
             RuntimeError: If operation fails
         """
+        if timeout is None:
+            timeout = self._timeout
+            
+        import py4j.java_gateway
         try:
             # Check if this is already a completed result (not a future)
             if not hasattr(future_result, 'get'):
                 return future_result
                 
             # Use Java's get() method with timeout
-            import py4j.java_gateway
-            TimeUnit = self._gateway.jvm.java.util.concurrent.TimeUnit
-            result = future_result.get(timeout, TimeUnit.SECONDS)
+            time_unit = self._jvm_classes().TimeUnit
+            result = future_result.get(timeout, time_unit.SECONDS)
             return result
             
         except py4j.java_gateway.Py4JJavaError as e:
-            if "TimeoutException" in str(e):
+            exception_class = _java_exception_class_name(e.java_exception)
+            if exception_class == 'java.util.concurrent.TimeoutException':
                 raise TimeoutError(f"Operation timed out after {timeout} seconds")
+            elif exception_class in self._retryable_exceptions:
+                raise _RetryableOperationError(f"Async operation failed: {e}")
             else:
                 raise RuntimeError(f"Async operation failed: {e}")
         except Exception as e:
             raise RuntimeError(f"Failed to handle async operation: {e}")
 
-    def _handle_async_operation_with_retry(self, operation_func, max_retries: int = 3, timeout: int = 30):
+    def _handle_async_operation_with_retry(self, operation_func, max_retries: Optional[int] = None,
+                                           timeout: Optional[int] = None):
         """
         Handle async operations with retry logic.
         
+        Only timeouts and transient Java exceptions are retried; any other
+        failure is raised from the first attempt.
+        
         Args:
             operation_func: Function that returns a CompletableFuture
-            max_retries: Maximum number of retry attempts
-            timeout: Timeout per attempt in seconds
+            max_retries: Maximum number of attempts, defaults to the connection's setting
+            timeout: Timeout per attempt in seconds, defaults to the connection's timeout
             
         Returns:
             The result of the async operation
         """
+        if max_retries is None:
+            max_retries = self._max_retries
         last_exception = None
         
         for attempt in range(max_retries):
             try:
                 future_result = operation_func()
                 return self._handle_async_operation(future_result, timeout)
-            except Exception as e:
+            except (TimeoutError, _RetryableOperationError) as e:
                 last_exception = e
                 logger.warning(f"Async operation attempt {attempt + 1} failed: {e}")
                 if attempt < max_retries - 1:
@@ -519,28 +597,47 @@ class FlussConnection:
                     
         raise RuntimeError(f"Async operation failed after {max_retries} attempts. Last error: {last_exception}")
 
-    def drop_database(self, database_name: str, if_exists: bool = True):
+    def _submit_async(self, func) -> Future:
+        """
+        Run a function on the connection's background executor.
+        
+        Args:
+            func: Function to run, typically wrapping _handle_async_operation_with_retry
+            
+        Returns:
+            Future holding the function's result
+        """
+        with self._async_executor_lock:
+            if self._async_executor is None:
+                self._async_executor = ThreadPoolExecutor(
+                    max_workers=_ASYNC_MAX_WORKERS, thread_name_prefix="fluss-admin")
+        return self._async_executor.submit(func)
+
+    def drop_database(self, database_name: str, if_exists: bool = True, async_: bool = False):
         """
         Drop a database.
         
         Args:
             database_name: Name of the database to drop
             if_exists: Whether to ignore if database doesn't exist
+            async_: Return a Future instead of waiting for the operation
             
         Returns:
-            True if successful
+            True if successful, or a Future resolving to the result if async_ is set
         """
         self._ensure_connected()
+        if async_:
+            return self._submit_async(functools.partial(
+                self.drop_database, database_name, if_exists))
         
         try:
-            # 使用缓存的连接获取admin
-            connection = self._get_connection()
-            admin = connection.getAdmin()
+            admin = self._get_admin()
             
             def drop_operation():
                 return admin.dropDatabase(database_name, False, False)  # cascade=False, ignoreIfNotExists=False
                 
             self._handle_async_operation_with_retry(drop_operation)
+            self._evict_data_writers(database_name)
             logger.info(f"Database dropped successfully: {database_name}")
             return True
             
@@ -548,7 +645,8 @@ class FlussConnection:
             logger.error(f"Failed to drop database {database_name}: {e}")
             return False
 
-    def drop_table(self, database_name: str, table_name: str, if_exists: bool = True):
+    def drop_table(self, database_name: str, table_name: str, if_exists: bool = True,
+                   async_: bool = False):
         """
         Drop a table.
         
@@ -556,24 +654,28 @@ class FlussConnection:
             database_name: Database name
             table_name: Table name
             if_exists: Whether to ignore if table doesn't exist
+            async_: Return a Future instead of waiting for the operation
             
         Returns:
-            True if successful
+            True if successful, or a Future resolving to the result if async_ is set
         """
         self._ensure_connected()
+        if async_:
+            return self._submit_async(functools.partial(
+                self.drop_table, database_name, table_name, if_exists))
         
         try:
-            # 使用缓存的连接获取admin
-            connection = self._get_connection()
-            admin = connection.getAdmin()
+            admin = self._get_admin()
             
             # Create table path
-            table_path = self._gateway.jvm.com.alibaba.fluss.metadata.TablePath.of(database_name, table_name)
+            table_path = self._jvm_classes().TablePath.of(database_name, table_name)
             
             def drop_operation():
                 return admin.dropTable(table_path, False)  # ignoreIfNotExists = False
                 
             self._handle_async_operation_with_retry(drop_operation)
+            
+            self._evict_data_writers(database_name, table_name)
             logger.info(f"Table dropped successfully: {database_name}.{table_name}")
             return True
             
@@ -599,25 +701,22 @@ class FlussConnection:
             connection = self._get_connection()
             table = connection.getTable(database_name, table_name)
             
-            # Get table info and schema
-            table_info = table.getTableInfo()
-            row_type = table_info.getRowType()
-            
-            # Get column information
-            field_names = row_type.getFieldNames()
-            field_types = row_type.getChildren()  # getChildren() returns List<DataType>
-            
-            columns = []
-            for i in range(field_names.size()):
-                columns.append({
-                    'name': field_names.get(i),
-                    'type': str(field_types.get(i)),
-                    'nullable': True  # Default assumption
-                })
-            
-            # Get primary keys (if available)
-            primary_keys = []
-            # Primary key extraction from table schema if available
+            # Columns and primary keys come back flattened in a single call:
+            # column count, then name/type/nullable per column, then the keys
+            parts = self._jvm_classes().FlussPy4JUtils.describeTable(table).split(_ENTRY_SEPARATOR)
+            column_count = int(parts[0])
+            column_end = 1 + 3 * column_count
+            column_parts = iter(parts[1:column_end])
+            
+            columns = [
+                {
+                    'name': name,
+                    'type': type_string,
+                    'nullable': nullable == 'true'
+                }
+                for name, type_string, nullable in zip(column_parts, column_parts, column_parts)
+            ]
+            primary_keys = parts[column_end:]
             
             return {
                 'columns': columns,
@@ -639,42 +738,74 @@ class FlussConnection:
         Returns:
             Fluss DataType object
         """
-        col_type = col_type.upper()
+        # DataTypes are immutable, so columns of the same type share one
+        data_type = self._data_types_by_name.get(col_type)
+        if data_type is None:
+            data_type = self._create_fluss_datatype(col_type.upper())
+            self._data_types_by_name[col_type] = data_type
+        return data_type
+
+    def _create_fluss_datatype(self, col_type: str):
+        """
+        Create the Fluss DataType for an upper-cased type string.
         
+        Args:
+            col_type: Upper-cased type string
+            
+        Returns:
+            Fluss DataType object
+        """
         # Handle PyArrow types
-        if col_type in ['STRING', 'VARCHAR']:
-            return self._gateway.jvm.com.alibaba.fluss.types.DataTypes.STRING()
-        elif col_type in ['INT64', 'BIGINT', 'LONG']:
-            return self._gateway.jvm.com.alibaba.fluss.types.DataTypes.BIGINT()
-        elif col_type in ['INT32', 'INT', 'INTEGER']:
-            return self._gateway.jvm.com.alibaba.fluss.types.DataTypes.INT()
-        elif col_type in ['FLOAT64', 'DOUBLE', 'FLOAT']:
-            return self._gateway.jvm.com.alibaba.fluss.types.DataTypes.DOUBLE()
-        elif col_type in ['FLOAT32']:
-            return self._gateway.jvm.com.alibaba.fluss.types.DataTypes.FLOAT()
-        elif col_type in ['BOOL', 'BOOLEAN']:
-            return self._gateway.jvm.com.alibaba.fluss.types.DataTypes.BOOLEAN()
+        factory_name = _FLUSS_TYPE_FACTORIES.get(col_type)
+        if factory_name is not None:
+            return self._fluss_data_type(factory_name)
         elif col_type.startswith('TIMESTAMP'):
             # Handle timestamp types
-            return self._gateway.jvm.com.alibaba.fluss.types.DataTypes.TIMESTAMP(3)  # Default precision
+            return self._fluss_data_type('TIMESTAMP', 3)  # Default precision
         elif col_type.startswith('DECIMAL'):
             # Handle decimal types - extract precision and scale if available
-            import re
-            match = re.match(r'DECIMAL\((\d+),?\s*(\d+)?\)', col_type)
+            match = _DECIMAL_RE.match(col_type)
             if match:
                 precision = int(match.group(1))
                 scale = int(match.group(2)) if match.group(2) else 0
-                return self._gateway.jvm.com.alibaba.fluss.types.DataTypes.DECIMAL(precision, scale)
+                return self._fluss_data_type('DECIMAL', precision, scale)
             else:
-                return self._gateway.jvm.com.alibaba.fluss.types.DataTypes.DECIMAL(10, 2)  # Default
+                return self._fluss_data_type('DECIMAL', 10, 2)  # Default
         else:
             # Default to string for unknown types
             logger.warning(f"Unknown type '{col_type}', defaulting to STRING")
-            return self._gateway.jvm.com.alibaba.fluss.types.DataTypes.STRING()
+            return self._fluss_data_type('STRING')
+
+    def _fluss_data_type(self, factory_name: str, *args):
+        """
+        Call a static DataTypes factory through a cached method handle.
+        
+        Resolving ``DataTypes.<name>`` on a Py4J class is itself a
+        reflection round trip, so each factory is looked up once.
+        
+        Args:
+            factory_name: DataTypes static method name (e.g. 'STRING')
+            *args: Arguments for the factory, such as precision and scale
+            
+        Returns:
+            Fluss DataType object
+        """
+        factory = self._data_type_factories.get(factory_name)
+        if factory is None:
+            factory = getattr(self._jvm_classes().DataTypes, factory_name)
+            self._data_type_factories[factory_name] = factory
+        return factory(*args)
+
+    def _jvm_classes(self):
+        """Get the cached Java class handles for this connection's gateway."""
+        from pyfluss.py4j.util.jvm_cache import get_jvm_classes
+        return get_jvm_classes(self._gateway)
 
     def _ensure_connected(self):
         """Ensure connection is established."""
-        if not self.is_connected():
+        # close() clears _is_connected before tearing anything down, so the
+        # flag alone implies a live gateway
+        if not self._is_connected:
             raise ConnectionError("Not connected to Fluss. Call connect() first.")
             
     def _get_jar_path(self) -> str:
@@ -687,36 +818,29 @@ class FlussConnection:
             
         return jar_path
         
-    def _start_java_gateway_server(self, jar_path: str):
-        """Start the Java gateway server process."""
-        # Clean up any existing Java processes
-        try:
-            subprocess.run(["pkill", "-f", "SimplePy4JGatewayServer"], check=False)
-            time.sleep(1)  # Give processes time to clean up
-        except Exception:
-            pass  # Ignore errors in cleanup
-        
-        # Start new Java process
-        java_cmd = [
-            "java",
-            "-cp", jar_path,
-            "org.example.SimplePy4JGatewayServer"
-        ]
-        
-        logger.debug(f"Starting Java gateway server: {' '.join(java_cmd)}")
-        
-        self._java_process = subprocess.Popen(
-            java_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        
-        # Check if process started successfully
-        time.sleep(1)
-        if self._java_process.poll() is not None:
-            stdout, stderr = self._java_process.communicate()
-            error_msg = f"Java process failed to start. stdout: {stdout.decode()}, stderr: {stderr.decode()}"
-            raise RuntimeError(error_msg)
+    def _start_java_gateway_server(self, jar_path: str) -> int:
+        """
+        Start the Java gateway server process.
+        
+        Args:
+            jar_path: Path of the shaded JAR, which also provides py4j.GatewayServer
+            
+        Returns:
+            Port the gateway server is listening on
+        """
+        from py4j.java_gateway import launch_gateway
+        
+        logger.debug(f"Starting Java gateway server with classpath: {jar_path}")
+        
+        # launch_gateway binds an ephemeral port and only returns once the JVM
+        # has reported it, so there is no fixed startup delay and no clash with
+        # gateways owned by other processes. die_on_exit ties the JVM to this
+        # Python process; the handle is kept so close() can stop it earlier.
+        # The JVM's stdout is drained by py4j's consumer thread and stderr
+        # goes to os.devnull, so a chatty JVM cannot block on a full pipe.
+        port, self._java_process = launch_gateway(
+            jarpath=jar_path, die_on_exit=True, return_proc=True)
+        return port
             
     def _test_connection(self):
         """Test if the Java gateway connection is working."""
@@ -736,6 +860,63 @@ class FlussConnection:
             
         return self._java_connection
 
+    def _checkout_connection(self):
+        """
+        Get the Java connection bound to the calling thread.
+        
+        With a pool size of 1 (the default) every thread shares the cached
+        connection. Otherwise each thread borrows one connection from a
+        Java-side pool on first use and keeps it until close().
+        
+        Returns:
+            Java FlussConnection
+        """
+        if self._connection_pool_size <= 1:
+            return self._get_connection()
+            
+        connection = getattr(self._thread_connections, 'connection', None)
+        if connection is None:
+            self._ensure_connected()
+            with self._java_connection_pool_lock:
+                if self._java_connection_pool is None:
+                    self._java_connection_pool = self._java_app.createConnectionPool(
+                        self.server_address, self._connection_pool_size)
+            connection = self._java_connection_pool.borrow()
+            self._thread_connections.connection = connection
+        return connection
+
+    def _evict_data_writers(self, database_name: str, table_name: Optional[str] = None):
+        """
+        Discard cached Java writers after a drop, so that a table recreated
+        under the same name does not get a writer bound to the old table.
+        
+        Every drop, through this class or through Admin, goes through here.
+        
+        Args:
+            database_name: Database of the dropped table, or the dropped database
+            table_name: Dropped table, or None for every table of the database
+        """
+        connections = [self._get_connection()]
+        if self._java_connection_pool is not None:
+            connections.append(self._java_connection_pool)
+        for connection in connections:
+            if table_name is None:
+                connection.evictDataWriters(database_name)
+            else:
+                connection.evictDataWriter(database_name, table_name)
+
+    def _get_admin(self):
+        """Get the Java Admin, created once per Java connection."""
+        if self._admin is None:
+            self._admin = self._get_connection().getAdmin()
+        return self._admin
+
+    def _get_reader_factory(self):
+        """Get the Java reader factory, created once per gateway."""
+        if self._reader_factory is None:
+            self._reader_factory = self._gateway.jvm.org.example.FlussDataReaderFactory()
+        return self._reader_factory
+
     def getAdmin(self):
         """
         Get admin instance for administrative operations.
@@ -743,21 +924,23 @@ class FlussConnection:
         Returns:
             Admin wrapper instance
         """
-        connection = self._get_connection()
-        java_admin = connection.getAdmin()
-        from pyfluss.api.admin import Admin
-        return Admin(java_admin, self._gateway, self)
+        return Admin(self._get_admin(), self._gateway, self)
         
 
-# Global connection instance for convenience
-_global_connection: Optional[FlussConnection] = None
+# Process-wide connections for the module-level helpers, keyed by server
+# address and ordered from least to most recently used
+_connection_pool: "OrderedDict[str, FlussConnection]" = OrderedDict()
+_connection_refcounts: Dict[str, int] = {}
+_connection_pool_lock = threading.Lock()
 
 def connect(server_address: str = "localhost:9123") -> FlussConnection:
     """
     Create and establish a connection to Fluss cluster.
     
     This is the main entry point for PyFluss. It automatically manages
-    the Java gateway connection and provides a clean API.
+    the Java gateway connection and provides a clean API. Connections are
+    shared per server address, so repeated calls reuse the running JVM;
+    each call should be matched by a disconnect().
     
     Args:
         server_address: Fluss server address in format "host:port"
@@ -771,23 +954,44 @@ def connect(server_address: str = "localhost:9123") -> FlussConnection:
         >>> catalog = conn.get_catalog()
         >>> writer = conn.create_writer("my_database.my_table")
     """
-    global _global_connection
-    
-    # Close existing global connection if any
-    if _global_connection:
-        _global_connection.close()
-        
-    _global_connection = FlussConnection(server_address)
-    _global_connection.connect()
-    return _global_connection
+    with _connection_pool_lock:
+        connection = _connection_pool.get(server_address)
+        if connection is None or not connection.is_connected():
+            connection = FlussConnection(server_address)
+            connection.connect()
+            _connection_pool[server_address] = connection
+            _connection_refcounts[server_address] = 0
+            
+        _connection_pool.move_to_end(server_address)
+        _connection_refcounts[server_address] += 1
+        return connection
 
-def disconnect():
-    """Close the global connection."""
-    global _global_connection
-    if _global_connection:
-        _global_connection.close()
-        _global_connection = None
+def disconnect(server_address: Optional[str] = None):
+    """
+    Release a connection obtained from connect().
+    
+    The connection is closed once every connect() for its address has
+    been released.
+    
+    Args:
+        server_address: Address to release, defaults to the most recently used one
+    """
+    with _connection_pool_lock:
+        if server_address is None:
+            if not _connection_pool:
+                return
+            server_address = next(reversed(_connection_pool))
+        if server_address not in _connection_pool:
+            return
+            
+        _connection_refcounts[server_address] -= 1
+        if _connection_refcounts[server_address] <= 0:
+            del _connection_refcounts[server_address]
+            _connection_pool.pop(server_address).close()
 
 def get_connection() -> Optional[FlussConnection]:
-    """Get the current global connection."""
-    return _global_connection
+    """Get the most recently used connection."""
+    with _connection_pool_lock:
+        if not _connection_pool:
+            return None
+        return _connection_pool[next(reversed(_connection_pool))]
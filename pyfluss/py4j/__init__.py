@@ -17,12 +17,29 @@
 ################################################################################
 
 from .util import constants
-from .java_implementation import (
-    Catalog, Table, ReadBuilder, TableScan, Plan, RowType,
-    FlussTableRead, BatchWriteBuilder, BatchTableWrite, FlussSchema
-)
 from .java_gateway import get_gateway
 
+# Loaded on first access, since java_implementation imports pandas and
+# pyarrow and pyfluss.py4j.util is needed without them
+_LAZY_IMPLEMENTATION_EXPORTS = (
+    'Catalog', 'Table', 'ReadBuilder', 'TableScan', 'Plan', 'RowType',
+    'FlussTableRead', 'BatchWriteBuilder', 'BatchTableWrite', 'FlussSchema'
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPLEMENTATION_EXPORTS:
+        from . import java_implementation
+        value = getattr(java_implementation, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPLEMENTATION_EXPORTS))
+
+
 __all__ = [
     'constants',
     'get_gateway',
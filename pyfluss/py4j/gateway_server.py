@@ -16,17 +16,28 @@
 # limitations under the License.
 ################################################################################
 
+import functools
 import importlib.resources
+import logging
 import os
 import platform
+import shutil
 import signal
-import subprocess
-from subprocess import Popen, PIPE
+import threading
+from collections import deque
+from subprocess import Popen, DEVNULL, PIPE
 from pyfluss.py4j.util import constants
 
+logger = logging.getLogger(__name__)
+
+_ON_WINDOWS = platform.system() == "Windows"
+
+# Number of trailing JVM stderr lines kept for startup failure messages
+_STDERR_TAIL_LINES = 50
+
 
 def on_windows():
-    return platform.system() == "Windows"
+    return _ON_WINDOWS
 
 
 def find_java_executable():
@@ -40,12 +51,9 @@ def find_java_executable():
             return java_executable
     
     # Try to find java in PATH
-    try:
-        result = subprocess.run(['which', 'java'], capture_output=True, text=True)
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except Exception:
-        pass
+    java_executable = shutil.which('java')
+    if java_executable:
+        return java_executable
     
     raise EnvironmentError("Java executable not found. Please set JAVA_HOME or add java to PATH.")
 
@@ -68,8 +76,46 @@ def launch_gateway_server_process(env):
     if constants.PYFLUSS_MAIN_ARGS in env:
         command.extend(env[constants.PYFLUSS_MAIN_ARGS].split())
     
-    # Start the process
-    return Popen(command, stdout=PIPE, stderr=PIPE, env=env)
+    # Start the process. Nothing reads the JVM's stdout, so it goes to devnull.
+    # stderr is drained line by line on a thread, so it cannot fill up and
+    # block the JVM, but its tail is still there to explain a failed start.
+    # Leaving close_fds off (Python's own fds are non-inheritable anyway)
+    # lets Popen use posix_spawn instead of fork+exec where available.
+    proc = Popen(command, stdout=DEVNULL, stderr=PIPE, close_fds=False, env=env)
+    proc.stderr_tail = deque(maxlen=_STDERR_TAIL_LINES)
+    proc.stderr_drain = threading.Thread(target=_drain_stderr, args=(proc.stderr, proc.stderr_tail),
+                                         name="pyfluss-gateway-stderr", daemon=True)
+    proc.stderr_drain.start()
+    return proc
+
+
+def _drain_stderr(stream, tail):
+    """Log each JVM stderr line at debug level and keep the last ones in tail."""
+    with stream:
+        for line in iter(stream.readline, b''):
+            text = line.decode('utf-8', errors='replace').rstrip()
+            tail.append(text)
+            logger.debug("Java gateway: %s", text)
+
+
+def gateway_stderr_tail(proc, timeout=1.0):
+    """
+    Get the last lines the gateway server process wrote to stderr.
+    
+    Once the process has exited, waits up to timeout seconds for the drain
+    thread to read what is left in the pipe.
+    
+    Args:
+        proc: Process returned by launch_gateway_server_process
+        timeout: Seconds to wait for the drain thread of an exited process
+        
+    Returns:
+        The trailing stderr lines joined by newlines, or an empty string
+    """
+    drain = getattr(proc, 'stderr_drain', None)
+    if drain is not None and proc.poll() is not None:
+        drain.join(timeout)
+    return '\n'.join(getattr(proc, 'stderr_tail', ()))
 
 
 _JAVA_DEPS_PACKAGE = 'pyfluss.jars'
@@ -83,11 +129,9 @@ def _get_classpath(env):
     test_mode = os.environ.get(constants.PYFLUSS4J_TEST_MODE)
     if not test_mode or test_mode.lower() != "true":
         try:
-            jars = importlib.resources.files(_JAVA_DEPS_PACKAGE)
-            one_jar = next(iter(jars.iterdir()), None)
-            if not one_jar:
+            builtin_java_classpath = _builtin_jar_classpath(_JAVA_DEPS_PACKAGE)
+            if builtin_java_classpath is None:
                 raise ValueError("Haven't found necessary python-java-bridge jar, this is unexpected.")
-            builtin_java_classpath = os.path.join(os.path.dirname(str(one_jar)), '*')
             classpath.append(builtin_java_classpath)
         except Exception:
             # In development mode, jars might not be packaged
@@ -117,13 +161,27 @@ def _get_hadoop_classpath(env):
     else:
         # use built-in hadoop
         try:
-            jars = importlib.resources.files(_HADOOP_DEPS_PACKAGE)
-            one_jar = next(iter(jars.iterdir()), None)
-            if not one_jar:
+            hadoop_classpath = _builtin_jar_classpath(_HADOOP_DEPS_PACKAGE)
+            if hadoop_classpath is None:
                 raise EnvironmentError(f"The built-in Hadoop environment has been broken, this "
                                      f"is unexpected. You can set one of '{constants.PYFLUSS_HADOOP_CLASSPATH}' or "
                                      f"'HADOOP_CLASSPATH' to continue.")
-            return os.path.join(os.path.dirname(str(one_jar)), '*')
+            return hadoop_classpath
         except Exception:
             # In development mode, hadoop deps might not be packaged
             return None
+
+
+@functools.lru_cache(maxsize=None)
+def _builtin_jar_classpath(package):
+    """
+    Get the wildcard classpath entry for the jars bundled in a package.
+
+    Packaged resources do not change while the process runs, so each
+    package directory is only listed once.
+    """
+    jars = importlib.resources.files(package)
+    one_jar = next(iter(jars.iterdir()), None)
+    if not one_jar:
+        return None
+    return os.path.join(os.path.dirname(str(one_jar)), '*')
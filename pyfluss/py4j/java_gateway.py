@@ -19,13 +19,25 @@
 import atexit
 import os
 import signal
+import socket
+import sys
+import threading
 import time
-from py4j.java_gateway import JavaGateway, GatewayParameters
-from .gateway_server import launch_gateway_server_process
+from py4j.java_gateway import DEFAULT_PORT, JavaGateway, GatewayParameters
+from .gateway_server import gateway_stderr_tail, launch_gateway_server_process
 from .util import constants
 
 _gateway = None
 _gateway_proc = None
+_gateway_lock = threading.Lock()
+
+# How long to wait for the gateway server to accept connections, and how
+# often to probe it
+_GATEWAY_STARTUP_TIMEOUT = 30.0
+_GATEWAY_PROBE_INTERVAL = 0.05
+
+# How long to wait for the gateway server to exit before killing it
+_GATEWAY_SHUTDOWN_TIMEOUT = 0.5
 
 
 def get_gateway():
@@ -35,35 +47,78 @@ def get_gateway():
     if _gateway is not None:
         return _gateway
     
-    # Check if we're in test mode
-    test_mode = os.environ.get(constants.PYFLUSS4J_TEST_MODE)
-    if test_mode and test_mode.lower() == "true":
-        # In test mode, assume gateway is already running
-        _gateway = JavaGateway(gateway_parameters=GatewayParameters(auto_convert=True))
-        return _gateway
-    
-    # Launch gateway server process
-    env = dict(os.environ)
-    _gateway_proc = launch_gateway_server_process(env)
-    
-    # Wait a bit for the server to start
-    time.sleep(2)
-    
-    # Connect to the gateway
-    _gateway = JavaGateway(gateway_parameters=GatewayParameters(auto_convert=True))
-    
-    # Register cleanup function
-    atexit.register(_cleanup_gateway)
-    
-    # Handle signals for cleanup
-    if hasattr(signal, 'SIGTERM'):
-        signal.signal(signal.SIGTERM, _signal_handler)
-    if hasattr(signal, 'SIGINT'):
-        signal.signal(signal.SIGINT, _signal_handler)
+    # Threads racing on the first call must not launch or connect twice
+    with _gateway_lock:
+        if _gateway is not None:
+            return _gateway
+        
+        # Check if we're in test mode
+        test_mode = os.environ.get(constants.PYFLUSS4J_TEST_MODE)
+        if test_mode and test_mode.lower() == "true":
+            # In test mode, assume gateway is already running
+            _gateway = _connect_gateway()
+            return _gateway
+        
+        # Launch gateway server process
+        env = dict(os.environ)
+        _gateway_proc = launch_gateway_server_process(env)
+        
+        # Wait until the server accepts connections instead of a fixed delay
+        _wait_for_gateway_server(_gateway_proc, DEFAULT_PORT)
+        
+        # Connect to the gateway
+        _gateway = _connect_gateway()
+        
+        # Register cleanup function
+        atexit.register(_cleanup_gateway)
+        
+        # Ctrl-C already ends in KeyboardInterrupt and atexit, but SIGTERM
+        # kills the interpreter without running atexit. Turn it into an exit
+        # unless the application handles it itself; only the main thread
+        # may install handlers.
+        if (hasattr(signal, 'SIGTERM')
+                and threading.current_thread() is threading.main_thread()
+                and signal.getsignal(signal.SIGTERM) == signal.SIG_DFL):
+            signal.signal(signal.SIGTERM, _signal_handler)
     
     return _gateway
 
 
+def _connect_gateway():
+    """
+    Connect to the gateway server and warm up the connection.
+    
+    eager_load makes the constructor issue a System.currentTimeMillis() call,
+    so the first socket and the JVM side of the call path are set up here
+    rather than on the caller's first real Java call.
+    """
+    return JavaGateway(gateway_parameters=GatewayParameters(auto_convert=True, eager_load=True))
+
+
+def _wait_for_gateway_server(proc, port, timeout=_GATEWAY_STARTUP_TIMEOUT):
+    """Block until the gateway server listens on port, or fail if it cannot start."""
+    deadline = time.monotonic() + timeout
+    while True:
+        if proc.poll() is not None:
+            raise RuntimeError(
+                f"Java gateway process exited with code {proc.returncode} before it was ready"
+                f"{_format_stderr_tail(proc)}")
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=_GATEWAY_PROBE_INTERVAL).close()
+            return
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Java gateway did not start listening on port {port} "
+                                   f"within {timeout} seconds{_format_stderr_tail(proc)}")
+            time.sleep(_GATEWAY_PROBE_INTERVAL)
+
+
+def _format_stderr_tail(proc):
+    """Format the gateway process's last stderr lines for an error message."""
+    tail = gateway_stderr_tail(proc)
+    return f"; last stderr output:\n{tail}" if tail else ""
+
+
 def _cleanup_gateway():
     """Clean up the gateway and its process."""
     global _gateway, _gateway_proc
@@ -78,7 +133,7 @@ def _cleanup_gateway():
     if _gateway_proc is not None:
         try:
             _gateway_proc.terminate()
-            _gateway_proc.wait(timeout=5)
+            _gateway_proc.wait(timeout=_GATEWAY_SHUTDOWN_TIMEOUT)
         except Exception:
             try:
                 _gateway_proc.kill()
@@ -88,6 +143,5 @@ def _cleanup_gateway():
 
 
 def _signal_handler(signum, frame):
-    """Handle signals for graceful shutdown."""
-    _cleanup_gateway()
-    exit(0)
+    """Exit on SIGTERM so atexit cleanup runs."""
+    sys.exit(128 + signum)
@@ -16,26 +16,41 @@
 # limitations under the License.
 ################################################################################
 
-import os
+import base64
+import copy
+import queue
+import threading
 from typing import Dict, List, Optional, Any, Iterator, TYPE_CHECKING
 
 # pyfluss.api implementation based on Java code & py4j lib
 
 try:
-    import pandas as pd
     import pyarrow as pa
 except ImportError:
-    pd = None
     pa = None
 
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from py4j.java_collections import JavaList, JavaMap
+
 from pyfluss.py4j.java_gateway import get_gateway
 from pyfluss.py4j.util import java_utils, constants
-from pyfluss.py4j.util.java_utils import serialize_java_object, deserialize_java_object
+from pyfluss.py4j.util.jvm_cache import get_jvm_classes
+from pyfluss.py4j.util.java_utils import deserialize_java_object
 from pyfluss.api import (
     catalog, table, read_builder, table_scan, row_type,
     fluss_table_read, write_builder, table_write
 )
 
+# Number of IPC streams fetched from the JVM ahead of the one being decoded
+_PREFETCH_STREAMS = 2
+
+# Must match org.example.FlussPy4JUtils.SEPARATOR
+_ENTRY_SEPARATOR = '\x00'
+
 if TYPE_CHECKING:
     try:
         import duckdb.duckdb
@@ -44,6 +59,40 @@ if TYPE_CHECKING:
         pass
 
 
+def _put_until_stopped(items: queue.Queue, item, stopped: threading.Event):
+    """Put an item into a bounded queue unless the consumer has gone away."""
+    while not stopped.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            pass
+
+
+def _split_or_none(encoded: str) -> Optional[List[str]]:
+    """Split a FlussPy4JUtils.joinToString result, None when it is empty."""
+    return encoded.split(_ENTRY_SEPARATOR) if encoded else None
+
+
+def _copy_or_none(values: Optional[List[str]]) -> Optional[List[str]]:
+    """Copy a cached list so callers cannot mutate the cache."""
+    return None if values is None else list(values)
+
+
+def _java_to_python(value):
+    """Recursively convert Py4J maps and lists to native Python containers."""
+    if isinstance(value, JavaMap):
+        return {key: _java_to_python(item) for key, item in value.items()}
+    if isinstance(value, JavaList):
+        return [_java_to_python(item) for item in value]
+    return value
+
+
+def _jvm_classes():
+    """Get the cached Java class handles for the shared gateway."""
+    return get_jvm_classes(get_gateway())
+
+
 class Catalog(catalog.Catalog):
     """Fluss Catalog implementation using py4j."""
 
@@ -55,8 +104,7 @@ class Catalog(catalog.Catalog):
     def create(catalog_options: dict) -> 'Catalog':
         """Create a new catalog instance."""
         j_catalog_context = java_utils.to_j_catalog_context(catalog_options)
-        gateway = get_gateway()
-        j_catalog = gateway.jvm.org.example.FlussClientBridge.createCatalog(j_catalog_context)
+        j_catalog = _jvm_classes().FlussClientBridge.createCatalog(j_catalog_context)
         return Catalog(j_catalog, catalog_options)
 
     def get_table(self, identifier: str) -> 'Table':
@@ -85,30 +133,30 @@ class Table(table.Table):
     def __init__(self, j_table, catalog_options: dict):
         self._j_table = j_table
         self._catalog_options = catalog_options
+        # Row type and keys are fixed for a table, fetched on first read
+        self._j_row_type = None
+        self._primary_keys = None
+        self._partition_keys = None
 
     def new_read_builder(self) -> 'ReadBuilder':
         """Create a new read builder for this table."""
-        j_read_builder = get_gateway().jvm.org.example.FlussClientBridge.createReadBuilder(self._j_table)
+        j_read_builder = _jvm_classes().FlussClientBridge.createReadBuilder(self._j_table)
         
-        # Get primary keys
-        if hasattr(self._j_table, 'primaryKeys') and not self._j_table.primaryKeys().isEmpty():
-            primary_keys = [str(key) for key in self._j_table.primaryKeys()]
-        else:
-            primary_keys = None
+        if self._j_row_type is None:
+            # Each key list comes back joined in one string rather than
+            # being walked element by element over the gateway
+            utils = _jvm_classes().FlussPy4JUtils
+            self._primary_keys = _split_or_none(utils.joinToString(self._j_table.primaryKeys()))
+            self._partition_keys = _split_or_none(utils.joinToString(self._j_table.partitionKeys()))
+            self._j_row_type = self._j_table.rowType()
         
-        # Get partition keys  
-        if hasattr(self._j_table, 'partitionKeys') and not self._j_table.partitionKeys().isEmpty():
-            partition_keys = [str(key) for key in self._j_table.partitionKeys()]
-        else:
-            partition_keys = None
-        
-        return ReadBuilder(j_read_builder, self._j_table.rowType(),
-                          self._catalog_options, primary_keys, partition_keys)
+        return ReadBuilder(j_read_builder, self._j_row_type, self._catalog_options,
+                          _copy_or_none(self._primary_keys), _copy_or_none(self._partition_keys))
 
     def new_batch_write_builder(self) -> 'BatchWriteBuilder':
         """Create a new batch write builder for this table."""
         java_utils.check_batch_write(self._j_table)
-        j_batch_write_builder = get_gateway().jvm.org.example.FlussClientBridge.createBatchWriteBuilder(self._j_table)
+        j_batch_write_builder = _jvm_classes().FlussClientBridge.createBatchWriteBuilder(self._j_table)
         return BatchWriteBuilder(j_batch_write_builder)
 
 
@@ -123,16 +171,25 @@ class ReadBuilder(read_builder.ReadBuilder):
         self._primary_keys = primary_keys
         self._partition_keys = partition_keys
         self._projection = None
+        self._field_index = None
 
     def with_projection(self, projection: List[str]) -> 'ReadBuilder':
         """Apply column projection to the read operation."""
         self._projection = projection
-        field_names = list(map(lambda field: field.name(), self._j_row_type.getFields()))
-        int_projection = list(map(lambda p: field_names.index(p), projection))
-        gateway = get_gateway()
-        int_projection_arr = gateway.new_array(gateway.jvm.int, len(projection))
-        for i in range(len(projection)):
-            int_projection_arr[i] = int_projection[i]
+        utils = _jvm_classes().FlussPy4JUtils
+        if self._field_index is None:
+            # The row type never changes, so fetch all names in one call
+            encoded = utils.joinToString(self._j_row_type.getFieldNames())
+            field_names = encoded.split(_ENTRY_SEPARATOR) if encoded else []
+            # Reversed so a duplicated name maps to its first position
+            self._field_index = {name: i for i, name in reversed(list(enumerate(field_names)))}
+        try:
+            int_projection = [self._field_index[p] for p in projection]
+        except KeyError as e:
+            raise ValueError(f"Projected field {e.args[0]!r} is not in the table schema") from None
+        # Build the int[] on the Java side instead of one assignment per element
+        int_projection_arr = utils.buildIntArray(
+            _ENTRY_SEPARATOR.join(map(str, int_projection)))
         self._j_read_builder.withProjection(int_projection_arr)
         return self
 
@@ -191,15 +248,20 @@ class Plan(table_scan.Plan):
 
     def table_buckets(self) -> List[Dict[str, Any]]:
         """Get the table buckets for this plan."""
-        buckets = []
-        for j_bucket in self._j_table_buckets:
-            bucket_info = {
-                'bucket_id': j_bucket.getBucketId() if hasattr(j_bucket, 'getBucketId') else 0,
-                'partition': str(j_bucket.getPartition()) if hasattr(j_bucket, 'getPartition') else None,
-                'metadata': serialize_java_object(j_bucket)
+        # One call returns bucket id, partition id and the serialized bucket
+        # for every bucket, instead of several round trips per bucket
+        encoded = _jvm_classes().FlussPy4JUtils.describeBuckets(self._j_table_buckets)
+        if not encoded:
+            return []
+        parts = encoded.split(_ENTRY_SEPARATOR)
+        return [
+            {
+                'bucket_id': int(bucket_id),
+                'partition': partition or None,
+                'metadata': base64.b64decode(metadata)
             }
-            buckets.append(bucket_info)
-        return buckets
+            for bucket_id, partition, metadata in zip(parts[0::3], parts[1::3], parts[2::3])
+        ]
 
 
 class BatchWriteBuilder(write_builder.BatchWriteBuilder):
@@ -221,52 +283,56 @@ class BatchWriteBuilder(write_builder.BatchWriteBuilder):
         return BatchTableWrite(j_batch_table_write, self._j_batch_write_builder.rowType())
 
 
-class BatchTableWrite(table_write.BatchTableWrite):
+class BatchTableWrite(table_write.BufferedBatchTableWrite):
     """Fluss BatchTableWrite implementation using py4j."""
 
-    def __init__(self, j_batch_table_write, j_row_type):
+    def __init__(self, j_batch_table_write, j_row_type,
+                 flush_bytes: int = table_write.DEFAULT_FLUSH_BYTES,
+                 max_batches: int = table_write.DEFAULT_MAX_BATCHES,
+                 batch_rows: Optional[int] = None):
+        super().__init__(flush_bytes, max_batches, batch_rows)
         self._j_batch_table_write = j_batch_table_write
-        self._j_bytes_writer = get_gateway().jvm.org.example.FlussDataWriter.createBytesWriter(
-            j_batch_table_write, j_row_type)
-        
+        # Every write path needs pyarrow, so without it there is no bytes
+        # writer or Arrow schema to set up
+        self._j_bytes_writer = None
         if pa:
+            self._j_bytes_writer = _jvm_classes().FlussDataWriter.createBytesWriter(
+                j_batch_table_write, j_row_type)
             self._arrow_schema = java_utils.to_arrow_schema(j_row_type)
 
     def write_arrow(self, table):
         """Write an Arrow table."""
         if not pa:
             raise ImportError("PyArrow is required for Arrow table writing")
-            
-        for record_batch in table.to_reader():
-            self._write_arrow_batch(record_batch)
+        super().write_arrow(table)
 
     def write_arrow_batch(self, record_batch):
         """Write an Arrow record batch."""
-        self._write_arrow_batch(record_batch)
+        if not pa:
+            raise ImportError("PyArrow is required for Arrow batch writing")
+        super().write_arrow_batch(record_batch)
 
     def write_pandas(self, dataframe):
         """Write a Pandas DataFrame."""
         if not pd or not pa:
             raise ImportError("Pandas and PyArrow are required for DataFrame writing")
             
-        record_batch = pa.RecordBatch.from_pandas(dataframe, schema=self._arrow_schema)
-        self._write_arrow_batch(record_batch)
+        # Table.from_pandas converts columns on the Arrow thread pool
+        table = pa.Table.from_pandas(dataframe, schema=self._arrow_schema, preserve_index=False)
+        self.write_arrow(table)
 
-    def _write_arrow_batch(self, record_batch):
-        """Write an Arrow record batch to the underlying writer."""
-        if not pa:
-            raise ImportError("PyArrow is required for Arrow batch writing")
-            
-        stream = pa.BufferOutputStream()
-        with pa.RecordBatchStreamWriter(stream, record_batch.schema) as writer:
-            writer.write(record_batch)
-        arrow_bytes = stream.getvalue().to_pybytes()
-        self._j_bytes_writer.write(arrow_bytes)
+    def _write_ipc_stream(self, ipc_bytes):
+        """Write serialized Arrow IPC stream bytes to the underlying writer."""
+        self._j_bytes_writer.write(ipc_bytes)
 
     def close(self):
         """Close the write operation."""
-        self._j_batch_table_write.close()
-        self._j_bytes_writer.close()
+        try:
+            super().close()
+        finally:
+            self._j_batch_table_write.close()
+            if self._j_bytes_writer is not None:
+                self._j_bytes_writer.close()
 
 
 class FlussTableRead(fluss_table_read.FlussTableRead):
@@ -274,6 +340,7 @@ class FlussTableRead(fluss_table_read.FlussTableRead):
 
     def __init__(self, j_table_read, j_read_type, catalog_options, 
                  projection, primary_keys: List[str], partition_keys: List[str]):
+        super().__init__()
         self._j_table_read = j_table_read
         self._j_read_type = j_read_type
         self._catalog_options = catalog_options
@@ -285,7 +352,7 @@ class FlussTableRead(fluss_table_read.FlussTableRead):
             self._arrow_schema = java_utils.to_arrow_schema(j_read_type)
         
         # Create bytes reader for parallel processing
-        self._j_bytes_reader = get_gateway().jvm.org.example.FlussDataReader.createParallelBytesReader(
+        self._j_bytes_reader = _jvm_classes().FlussDataReader.createParallelBytesReader(
             j_table_read, j_read_type, FlussTableRead._get_max_workers(catalog_options))
 
     def to_arrow_from_buckets(self, table_buckets: List[Dict[str, Any]]):
@@ -318,20 +385,10 @@ class FlussTableRead(fluss_table_read.FlussTableRead):
 
     def read_batches(self, table_buckets: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
         """Read data in batches from table buckets."""
-        for bucket in table_buckets:
-            j_bucket = deserialize_java_object(bucket['metadata'])
-            j_reader = get_gateway().jvm.org.example.FlussDataReader.createBucketReader(
-                self._j_table_read, j_bucket)
-            
-            while j_reader.hasNext():
-                record = j_reader.next()
-                yield self._convert_record_to_dict(record)
-
-    def _convert_record_to_dict(self, j_record) -> Dict[str, Any]:
-        """Convert Java record to Python dictionary."""
-        # This would need proper implementation based on the record format
-        # For now, return a simple placeholder
-        return {"placeholder": "record_data"}
+        # Rows come from the same Arrow IPC path as the Arrow readers and are
+        # decoded here, rather than pulled from the JVM one record at a time
+        for record_batch in self.to_arrow_batch_reader_from_buckets(table_buckets):
+            yield from record_batch.to_pylist()
 
     @staticmethod
     def _get_max_workers(catalog_options):
@@ -346,13 +403,42 @@ class FlussTableRead(fluss_table_read.FlussTableRead):
         if not pa:
             raise ImportError("PyArrow is required for batch generation")
             
-        while True:
-            next_bytes = self._j_bytes_reader.next()
-            if next_bytes is None:
-                break
-            else:
-                stream_reader = pa.RecordBatchStreamReader(pa.BufferReader(next_bytes))
+        # Fetch the next stream from the JVM while the current one is decoded
+        streams = queue.Queue(maxsize=_PREFETCH_STREAMS)
+        stopped = threading.Event()
+        fetcher = threading.Thread(target=self._prefetch_streams, args=(streams, stopped),
+                                   name='pyfluss-batch-prefetch', daemon=True)
+        fetcher.start()
+        try:
+            while True:
+                stream_reader = streams.get()
+                if stream_reader is None:
+                    break
+                if isinstance(stream_reader, BaseException):
+                    raise stream_reader
                 yield from stream_reader
+        finally:
+            # Also reached when the consumer stops early
+            stopped.set()
+            fetcher.join()
+
+    def _prefetch_streams(self, streams: queue.Queue, stopped: threading.Event):
+        """Fetch stream readers into a queue until exhausted, failed or stopped."""
+        try:
+            while not stopped.is_set():
+                stream_reader = self._next_stream_reader()
+                _put_until_stopped(streams, stream_reader, stopped)
+                if stream_reader is None:
+                    return
+        except BaseException as e:
+            _put_until_stopped(streams, e, stopped)
+
+    def _next_stream_reader(self):
+        """Get a reader over the next Arrow IPC stream, or None when exhausted."""
+        next_bytes = self._j_bytes_reader.next()
+        if next_bytes is None:
+            return None
+        return pa.RecordBatchStreamReader(pa.BufferReader(next_bytes))
 
 
 class FlussSchema:
@@ -366,8 +452,11 @@ class FlussSchema:
     def _get_schema_map(self) -> Dict[str, Any]:
         """Get schema map using SchemaUtil.schemaToMap."""
         if self._schema_map is None:
-            gateway = get_gateway()
-            self._schema_map = gateway.jvm.org.example.SchemaUtil.schemaToMap(self._j_schema)
+            j_schema_map = _jvm_classes().SchemaUtil.schemaToMap(self._j_schema)
+            # Convert once so later accessors never go back over the socket
+            self._schema_map = _java_to_python(j_schema_map)
+            for field in self._schema_map.get('fields', []):
+                self._field_info_cache.setdefault(field['name'], dict(field, exists=True))
         return self._schema_map
 
     def get_field_names(self) -> List[str]:
@@ -394,19 +483,18 @@ class FlussSchema:
 
     def to_dict(self) -> Dict[str, Any]:
         """Converts the schema to a dictionary representation."""
-        return self._get_schema_map()
+        return copy.deepcopy(self._get_schema_map())
 
     def get_field_info(self, field_name: str) -> Dict[str, Any]:
         """Get detailed information about a specific field."""
+        self._get_schema_map()
         if field_name not in self._field_info_cache:
-            gateway = get_gateway()
-            field_info = gateway.jvm.org.example.SchemaUtil.getFieldInfo(self._j_schema, field_name)
+            field_info = _jvm_classes().SchemaUtil.getFieldInfo(self._j_schema, field_name)
             self._field_info_cache[field_name] = dict(field_info)
         
         return self._field_info_cache[field_name]
 
     def validate(self) -> Dict[str, Any]:
         """Validate the schema and return validation results."""
-        gateway = get_gateway()
-        validation_result = gateway.jvm.org.example.SchemaUtil.validateSchema(self._j_schema)
+        validation_result = _jvm_classes().SchemaUtil.validateSchema(self._j_schema)
         return dict(validation_result)
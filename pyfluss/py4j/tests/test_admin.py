@@ -0,0 +1,173 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import itertools
+import unittest
+from types import SimpleNamespace
+
+from pyfluss.connection import FlussConnection
+
+
+class _StubTablePath:
+    """Stands in for com.alibaba.fluss.metadata.TablePath."""
+
+    def __init__(self, database_name, table_name):
+        self._path = (database_name, table_name)
+
+    @staticmethod
+    def of(database_name, table_name):
+        return _StubTablePath(database_name, table_name)
+
+    def getDatabaseName(self):
+        return self._path[0]
+
+    def getTableName(self):
+        return self._path[1]
+
+
+class _StubCluster:
+    """Tables by path, each created table getting a new table id."""
+
+    def __init__(self):
+        self.tables = {}
+        self._ids = itertools.count(1)
+
+    def create(self, path):
+        self.tables.setdefault(path, next(self._ids))
+
+    def drop(self, path):
+        self.tables.pop(path, None)
+
+
+class _StubJavaAdmin:
+
+    def __init__(self, cluster):
+        self._cluster = cluster
+
+    def createTable(self, table_path, table_descriptor, if_not_exists):
+        self._cluster.create(table_path._path)
+
+    def dropTable(self, table_path, ignore_if_not_exists):
+        self._cluster.drop(table_path._path)
+
+    def dropDatabase(self, database_name, cascade, if_exists):
+        for path in [path for path in self._cluster.tables if path[0] == database_name]:
+            self._cluster.drop(path)
+
+
+class _StubJavaWriter:
+
+    def __init__(self, cluster, path):
+        self._cluster = cluster
+        self._path = path
+        self._table_id = cluster.tables[path]
+
+    def writeEncodedDataWithUpsert(self, encoded):
+        if self._cluster.tables.get(self._path) != self._table_id:
+            raise RuntimeError(f"Writer bound to dropped table id {self._table_id}")
+        # Row count of the buildRows encoding: each row is its width then its values
+        parts = encoded.split('\x00')
+        rows = pos = 0
+        while pos < len(parts):
+            pos += 1 + int(parts[pos])
+            rows += 1
+        return rows
+
+
+class _StubJavaConnection:
+    """Mirrors org.example.FlussConnection's per-table writer cache."""
+
+    def __init__(self, cluster):
+        self._cluster = cluster
+        self._admin = _StubJavaAdmin(cluster)
+        self.writers = {}
+
+    def getAdmin(self):
+        return self._admin
+
+    def getDataWriter(self, database_name, table_name):
+        path = (database_name, table_name)
+        if path not in self.writers:
+            self.writers[path] = _StubJavaWriter(self._cluster, path)
+        return self.writers[path]
+
+    def evictDataWriter(self, database_name, table_name):
+        self.writers.pop((database_name, table_name), None)
+
+    def evictDataWriters(self, database_name):
+        for path in [path for path in self.writers if path[0] == database_name]:
+            del self.writers[path]
+
+
+class _StubGateway:
+    """Gateway whose JVM view only resolves the TablePath class."""
+
+    def __init__(self):
+        metadata = SimpleNamespace(TablePath=_StubTablePath)
+        self.jvm = SimpleNamespace(
+            com=SimpleNamespace(alibaba=SimpleNamespace(fluss=SimpleNamespace(metadata=metadata))))
+
+
+def _stub_connection():
+    cluster = _StubCluster()
+    connection = FlussConnection()
+    connection._is_connected = True
+    connection._java_connection = _StubJavaConnection(cluster)
+    connection._gateway = _StubGateway()
+    return connection
+
+
+class TestAdminDropEvictsWriters(unittest.TestCase):
+    """Test that tables recreated after a drop get a fresh cached writer."""
+
+    def _write_after_recreate(self, drop):
+        connection = _stub_connection()
+        admin = connection.getAdmin()
+        admin.create_table('db.tbl', None)
+        self.assertEqual(1, connection.create_writer('db.tbl').write_rows([{'id': 1}]))
+        
+        drop(admin)
+        admin.create_table('db.tbl', None)
+        
+        self.assertEqual(1, connection.create_writer('db.tbl').write_rows([{'id': 2}]))
+
+    def test_admin_drop_table(self):
+        self._write_after_recreate(lambda admin: admin.drop_table('db.tbl'))
+
+    def test_admin_drop_table_async(self):
+        self._write_after_recreate(lambda admin: admin.drop_table('db.tbl', async_=True).result())
+
+    def test_admin_drop_database_cascade(self):
+        self._write_after_recreate(lambda admin: admin.drop_database('db', cascade=True))
+
+    def test_other_databases_keep_their_writers(self):
+        connection = _stub_connection()
+        admin = connection.getAdmin()
+        admin.create_table('db.tbl', None)
+        admin.create_table('other.tbl', None)
+        kept = connection.create_writer('other.tbl')
+        connection.create_writer('db.tbl')
+        
+        admin.drop_database('db', cascade=True)
+        
+        self.assertEqual({('other', 'tbl')}, set(connection._java_connection.writers))
+        self.assertIs(kept._java_writer, connection._java_connection.getDataWriter('other', 'tbl'))
+
+
+if __name__ == '__main__':
+    unittest.main()
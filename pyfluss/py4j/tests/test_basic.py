@@ -70,5 +70,29 @@ class TestBasicFunctionality(PyFlussTestBase):
         self.assertTrue(hasattr(constants, 'MAX_WORKERS'))
 
 
+class TestTablePath(unittest.TestCase):
+    """Test TablePath value semantics, which need no gateway."""
+
+    def test_equality_and_hash(self):
+        """Test that equal paths hash alike and different paths differ."""
+        from pyfluss.api.metadata import TablePath
+        
+        path = TablePath.of('db', 'tbl')
+        same = TablePath(database_name=''.join(['d', 'b']), table_name='tbl')
+        self.assertEqual(path, same)
+        self.assertEqual(hash(path), hash(same))
+        self.assertEqual(1, len({path, same}))
+        self.assertEqual('db.tbl', str(same))
+        
+        with_catalog = TablePath.of_catalog('cat', 'db', 'tbl')
+        self.assertEqual(with_catalog, TablePath.of_catalog('cat', 'db', 'tbl'))
+        self.assertEqual('cat.db.tbl', str(with_catalog))
+        for other in (with_catalog, TablePath.of('db', 'other'), TablePath.of('other', 'tbl')):
+            self.assertNotEqual(path, other)
+        # 'a.b' + 'c' and 'a' + 'b.c' format alike but are different paths
+        self.assertNotEqual(TablePath.of('a.b', 'c'), TablePath.of('a', 'b.c'))
+        self.assertNotEqual(path, 'db.tbl')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -16,12 +16,25 @@
 # limitations under the License.
 ################################################################################
 
+import functools
 import unittest
 import importlib
+import re
 import sys
 import os
 
 
+# major.minor.patch, optionally followed by a suffix
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+')
+
+
+@functools.lru_cache(maxsize=None)
+def _package_dir():
+    """Directory of the installed pyfluss package, resolved once per run."""
+    import pyfluss
+    return os.path.dirname(pyfluss.__file__)
+
+
 class TestPackageIntegrity(unittest.TestCase):
     """Test package integrity and import structure."""
 
@@ -35,7 +48,7 @@ class TestPackageIntegrity(unittest.TestCase):
         import pyfluss
         self.assertTrue(hasattr(pyfluss, '__version__'))
         self.assertIsInstance(pyfluss.__version__, str)
-        self.assertRegex(pyfluss.__version__, r'^\d+\.\d+\.\d+.*')
+        self.assertRegex(pyfluss.__version__, _VERSION_RE)
 
     def test_api_modules_importable(self):
         """Test that API modules can be imported."""
@@ -65,13 +78,13 @@ class TestPackageIntegrity(unittest.TestCase):
 
     def test_jar_file_exists(self):
         """Test that required JAR file exists."""
-        import pyfluss
-        package_dir = os.path.dirname(pyfluss.__file__)
-        jar_dir = os.path.join(package_dir, 'jars')
+        jar_dir = os.path.join(_package_dir(), 'jars')
         
         self.assertTrue(os.path.exists(jar_dir), "JAR directory not found")
         
-        jar_files = [f for f in os.listdir(jar_dir) if f.endswith('.jar')]
+        with os.scandir(jar_dir) as entries:
+            jar_files = [entry.name for entry in entries
+                         if entry.name.endswith('.jar') and entry.is_file()]
         self.assertGreater(len(jar_files), 0, "No JAR files found")
 
     def test_all_api_modules_exist(self):
@@ -132,10 +145,8 @@ class TestPackageConfiguration(unittest.TestCase):
         self.assertTrue(hasattr(pyfluss, '__version__'))
         
         # Test version format
-        version = pyfluss.__version__
-        version_parts = version.split('.')
-        self.assertGreaterEqual(len(version_parts), 3, 
-                              "Version should have at least 3 parts")
+        self.assertIsNotNone(_VERSION_RE.match(pyfluss.__version__),
+                             "Version should have at least 3 parts")
 
 
 if __name__ == '__main__':
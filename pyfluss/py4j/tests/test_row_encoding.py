@@ -0,0 +1,97 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import math
+import unittest
+
+from pyfluss.reader import _ENTRY_SEPARATOR, _decode_rows, _decode_value
+from pyfluss.writer import _encode_rows
+
+
+def _build_rows(encoded):
+    """Python mirror of org.example.FlussPy4JUtils.buildRows."""
+    parts = encoded.split(_ENTRY_SEPARATOR)
+    rows = []
+    pos = 0
+    while pos < len(parts):
+        width = int(parts[pos])
+        rows.append([_decode_value(part) for part in parts[pos + 1:pos + 1 + width]])
+        pos += 1 + width
+    return rows
+
+
+class TestRowEncoding(unittest.TestCase):
+    """Test the typed row encoding shared by the writer, the reader and FlussPy4JUtils."""
+
+    def assertRoundTrip(self, value):
+        decoded = _build_rows(_encode_rows([{'v': value}]))
+        self.assertEqual([[value]], decoded)
+        self.assertIs(type(value), type(decoded[0][0]))
+
+    def test_none(self):
+        self.assertEqual('1\x00N', _encode_rows([{'v': None}]))
+        self.assertRoundTrip(None)
+
+    def test_bool_is_not_encoded_as_int(self):
+        self.assertEqual('2\x00Btrue\x00Bfalse', _encode_rows([{'a': True, 'b': False}]))
+        self.assertRoundTrip(True)
+        self.assertRoundTrip(False)
+
+    def test_long_bounds(self):
+        for value in (0, -1, 2 ** 63 - 1, -2 ** 63):
+            self.assertRoundTrip(value)
+
+    def test_doubles(self):
+        for value in (0.0, -1.5, 0.1, 1e300, 5e-324, float('inf'), float('-inf')):
+            self.assertRoundTrip(value)
+        self.assertEqual('1\x00DInfinity\x001\x00D-Infinity',
+                         _encode_rows([{'v': float('inf')}, {'v': float('-inf')}]))
+
+    def test_nan(self):
+        self.assertEqual('1\x00DNaN', _encode_rows([{'v': float('nan')}]))
+        self.assertTrue(math.isnan(_build_rows(_encode_rows([{'v': float('nan')}]))[0][0]))
+
+    def test_strings(self):
+        for value in ('', 'text', '1', 'None', 'true', 'S', 'a,b=c'):
+            self.assertRoundTrip(value)
+
+    def test_string_containing_separator_is_not_encoded(self):
+        self.assertIsNone(_encode_rows([{'v': 'a' + _ENTRY_SEPARATOR + 'b'}]))
+
+    def test_multiple_rows_keep_order(self):
+        rows = [{'id': 1, 'name': 'a', 'score': 0.5},
+                {'id': 2, 'name': None, 'score': None}]
+        self.assertEqual([[1, 'a', 0.5], [2, None, None]], _build_rows(_encode_rows(rows)))
+
+    def test_decode_rows_from_java(self):
+        # As written by FlussPy4JUtils.appendValue, using Java's Double.toString
+        encoded = _ENTRY_SEPARATOR.join(
+            ['L1', 'Sa', 'D1.0E10', 'Btrue', 'L2', 'N', 'DNaN', 'Bfalse'])
+        rows = _decode_rows(encoded, ['id', 'name', 'score', 'flag'])
+        self.assertEqual(2, len(rows))
+        self.assertEqual({'id': 1, 'name': 'a', 'score': 1e10, 'flag': True}, rows[0])
+        self.assertEqual([2, None, False], [rows[1]['id'], rows[1]['name'], rows[1]['flag']])
+        self.assertTrue(math.isnan(rows[1]['score']))
+
+    def test_decode_empty(self):
+        self.assertEqual([], _decode_rows('', ['id']))
+        self.assertEqual([], _decode_rows('L1', []))
+
+
+if __name__ == '__main__':
+    unittest.main()
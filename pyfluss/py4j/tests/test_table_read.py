@@ -0,0 +1,88 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from pyfluss.api.fluss_table_read import _records_to_arrow_batch
+from pyfluss.reader import FlussDataReader
+
+
+class _StubDataReader(FlussDataReader):
+    """Data reader that returns fixed rows instead of reading through a Java reader."""
+
+    __slots__ = ('_rows',)
+
+    def __init__(self, rows):
+        super().__init__(java_reader=None, gateway=None)
+        self._rows = rows
+
+    def read_rows(self, limit: int = 100):
+        return self._rows[:limit]
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestRecordsToArrowBatch(unittest.TestCase):
+    """Test building Arrow batches from lists of records."""
+
+    def test_uniform_records(self):
+        batch = _records_to_arrow_batch([{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}])
+        self.assertEqual(batch.schema.names, ['id', 'name'])
+        self.assertEqual(batch.to_pylist(), [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}])
+
+    def test_keys_missing_from_first_record_are_kept(self):
+        batch = _records_to_arrow_batch([{'id': 1}, {'id': 2, 'name': 'b'}])
+        self.assertEqual(batch.schema.names, ['id', 'name'])
+        self.assertEqual(batch.to_pylist(), [{'id': 1, 'name': None}, {'id': 2, 'name': 'b'}])
+
+    def test_keys_missing_from_later_records_are_null(self):
+        batch = _records_to_arrow_batch([{'id': 1, 'name': 'a'}, {'name': 'b'}])
+        self.assertEqual(batch.schema.names, ['id', 'name'])
+        self.assertEqual(batch.column('id').to_pylist(), [1, None])
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestReaderToPandas(unittest.TestCase):
+    """Test FlussDataReader.to_pandas on uniform and ragged rows."""
+
+    def test_uniform_rows(self):
+        df = _StubDataReader([{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}]).to_pandas()
+        self.assertEqual(list(df.columns), ['id', 'name'])
+        self.assertEqual(df['id'].tolist(), [1, 2])
+
+    def test_ragged_rows_keep_every_column(self):
+        df = _StubDataReader([{'id': 1}, {'id': 2, 'name': 'b'}]).to_pandas()
+        self.assertEqual(list(df.columns), ['id', 'name'])
+        self.assertTrue(pd.isna(df['name'][0]))
+        self.assertEqual(df['name'][1], 'b')
+
+    def test_no_rows(self):
+        self.assertTrue(_StubDataReader([]).to_pandas().empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from pyfluss.api.table_write import BufferedBatchTableWrite
+
+
+class _StubJavaWriter:
+    """Stands in for the Java bytes writer and decodes every IPC stream it receives."""
+
+    def __init__(self):
+        self.streams = []
+
+    def write(self, ipc_bytes):
+        self.streams.append(pa.ipc.open_stream(ipc_bytes).read_all())
+
+
+class _StubTableWrite(BufferedBatchTableWrite):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.j_writer = _StubJavaWriter()
+
+    def _write_ipc_stream(self, ipc_bytes):
+        self.j_writer.write(ipc_bytes)
+
+
+def _batch(start, rows):
+    return pa.RecordBatch.from_pydict({'id': list(range(start, start + rows))})
+
+
+def _ids(tables):
+    return [value for table in tables for value in table.column('id').to_pylist()]
+
+
+@unittest.skipIf(pa is None, "pyarrow is required")
+class TestBufferedBatchTableWrite(unittest.TestCase):
+    """Test flush thresholds and ordering of BufferedBatchTableWrite."""
+
+    def test_flushes_at_max_batches(self):
+        write = _StubTableWrite(max_batches=3)
+        write.write_arrow_batch(_batch(0, 2))
+        write.write_arrow_batch(_batch(2, 2))
+        self.assertEqual([], write.j_writer.streams)
+        
+        write.write_arrow_batch(_batch(4, 2))
+        self.assertEqual(1, len(write.j_writer.streams))
+        self.assertEqual(list(range(6)), _ids(write.j_writer.streams))
+
+    def test_flushes_at_flush_bytes(self):
+        batch = _batch(0, 100)
+        write = _StubTableWrite(flush_bytes=batch.nbytes * 2)
+        write.write_arrow_batch(batch)
+        self.assertEqual([], write.j_writer.streams)
+        
+        write.write_arrow_batch(_batch(100, 100))
+        self.assertEqual(1, len(write.j_writer.streams))
+
+    def test_close_flushes_remaining_batches(self):
+        write = _StubTableWrite()
+        write.write_arrow_batch(_batch(0, 3))
+        write.write_arrow_batch(pa.RecordBatch.from_pydict({'id': pa.array([], pa.int64())}))
+        self.assertEqual([], write.j_writer.streams)
+        
+        write.close()
+        self.assertEqual([[0, 1, 2]], [t.column('id').to_pylist() for t in write.j_writer.streams])
+        write.close()
+        self.assertEqual(1, len(write.j_writer.streams))
+
+    def test_schema_change_flushes(self):
+        write = _StubTableWrite()
+        write.write_arrow_batch(_batch(0, 2))
+        write.write_arrow_batch(pa.RecordBatch.from_pydict({'name': ['a']}))
+        self.assertEqual(1, len(write.j_writer.streams))
+        
+        write.close()
+        self.assertEqual(['id'], write.j_writer.streams[0].schema.names)
+        self.assertEqual(['name'], write.j_writer.streams[1].schema.names)
+
+    def test_write_arrow_splits_and_keeps_row_order(self):
+        write = _StubTableWrite(max_batches=2, batch_rows=10)
+        write.write_arrow(pa.Table.from_batches([_batch(0, 15), _batch(15, 40)]))
+        write.close()
+        self.assertEqual(3, len(write.j_writer.streams))
+        self.assertEqual(list(range(55)), _ids(write.j_writer.streams))
+        self.assertTrue(all(batch.num_rows <= 10
+                            for table in write.j_writer.streams for batch in table.to_batches()))
+
+    def test_ipc_stream_is_written_after_buffered_batches(self):
+        write = _StubTableWrite()
+        write.write_arrow_batch(_batch(0, 2))
+        batch = _batch(2, 2)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+        write.write_arrow_ipc_stream(sink.getvalue())
+        self.assertEqual([[0, 1], [2, 3]], [t.column('id').to_pylist() for t in write.j_writer.streams])
+
+    def test_async_writes_keep_order(self):
+        write = _StubTableWrite(max_batches=4)
+        futures = [write.write_arrow_batch_async(_batch(i * 5, 5)) for i in range(10)]
+        write.close()
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(list(range(50)), _ids(write.j_writer.streams))
+
+
+if __name__ == '__main__':
+    unittest.main()
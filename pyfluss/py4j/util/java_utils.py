@@ -16,53 +16,53 @@
 # limitations under the License.
 ################################################################################
 
+import functools
 import pickle
-import pyarrow as pa
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, List, Any, Optional, Tuple
 from py4j.java_gateway import JavaGateway
 
 from pyfluss.py4j.java_gateway import get_gateway
+from pyfluss.py4j.util.jvm_cache import get_jvm_classes
+
+# Must match org.example.FlussPy4JUtils.SEPARATOR
+_ENTRY_SEPARATOR = '\x00'
 
 
 def serialize_java_object(j_object):
     """Serialize a Java object to bytes using py4j."""
-    gateway = get_gateway()
-    byte_array = gateway.jvm.org.apache.commons.lang3.SerializationUtils.serialize(j_object)
+    byte_array = get_jvm_classes(get_gateway()).SerializationUtils.serialize(j_object)
     return bytes(byte_array)
 
 
 def deserialize_java_object(byte_data):
     """Deserialize bytes back to a Java object using py4j."""
-    gateway = get_gateway()
-    byte_array = gateway.new_array(gateway.jvm.byte, len(byte_data))
-    for i, b in enumerate(byte_data):
-        byte_array[i] = b
-    return gateway.jvm.org.apache.commons.lang3.SerializationUtils.deserialize(byte_array)
+    # Py4J sends bytes as a single byte[] argument, no per-slot assignment
+    return get_jvm_classes(get_gateway()).SerializationUtils.deserialize(bytes(byte_data))
 
 
 def to_j_identifier(identifier: str):
     """Convert Python string identifier to Java Identifier object."""
-    gateway = get_gateway()
+    mock_identifier = get_jvm_classes(get_gateway()).MockIdentifier
     parts = identifier.split('.')
     if len(parts) == 1:
         # Table name only
-        return gateway.jvm.org.example.CatalogFactory.MockIdentifier.of(parts[0])
+        return mock_identifier.of(parts[0])
     elif len(parts) == 2:
         # Database.table
-        return gateway.jvm.org.example.CatalogFactory.MockIdentifier.of(parts[0], parts[1])
+        return mock_identifier.of(parts[0], parts[1])
     else:
         raise ValueError(f"Invalid identifier format: {identifier}")
 
 
 def to_j_catalog_context(catalog_options: Dict[str, Any]):
     """Convert Python catalog options to Java CatalogContext."""
-    gateway = get_gateway()
-    j_options = gateway.jvm.java.util.HashMap()
-    
-    for key, value in catalog_options.items():
-        j_options.put(str(key), str(value))
+    jvm_classes = get_jvm_classes(get_gateway())
+    # All options go over in one call instead of one put() per entry
+    j_options = jvm_classes.FlussPy4JUtils.buildStringMap(_ENTRY_SEPARATOR.join(
+        str(part) for item in catalog_options.items() for part in item))
     
-    return gateway.jvm.org.example.CatalogFactory.MockCatalogContext.create(j_options)
+    return jvm_classes.MockCatalogContext.create(j_options)
 
 
 def to_fluss_schema(schema_dict: Dict[str, Any]):
@@ -83,51 +83,70 @@ def to_fluss_schema(schema_dict: Dict[str, Any]):
 
 def to_arrow_schema(j_row_type):
     """Convert Java RowType to PyArrow Schema."""
-    gateway = get_gateway()
-    
-    # Get field information from Java RowType
-    field_names = j_row_type.getFieldNames()
-    field_types = j_row_type.getChildren()
-    
-    arrow_fields = []
-    for i in range(len(field_names)):
-        field_name = field_names[i]
-        j_field_type = field_types[i]
-        
-        # Convert Java DataType to Arrow DataType
-        arrow_type = _java_type_to_arrow_type(j_field_type)
-        arrow_fields.append(pa.field(field_name, arrow_type))
-    
-    return pa.schema(arrow_fields)
-
-
-def _java_type_to_arrow_type(j_data_type):
-    """Convert Java DataType to Arrow DataType."""
-    type_str = str(j_data_type).lower()
-    
-    if 'int' in type_str:
-        return pa.int32()
-    elif 'bigint' in type_str:
-        return pa.int64()
-    elif 'string' in type_str or 'varchar' in type_str:
-        return pa.string()
-    elif 'double' in type_str:
-        return pa.float64()
-    elif 'float' in type_str:
-        return pa.float32()
-    elif 'boolean' in type_str:
-        return pa.bool_()
-    elif 'timestamp' in type_str:
-        return pa.timestamp('us')
-    elif 'date' in type_str:
-        return pa.date32()
-    elif 'decimal' in type_str:
-        return pa.decimal128(38, 18)  # Default precision and scale
-    elif 'bytes' in type_str or 'binary' in type_str:
-        return pa.binary()
-    else:
+    # Get field information from Java RowType, one call per list
+    utils = get_jvm_classes(get_gateway()).FlussPy4JUtils
+    field_names = _split_entries(utils.joinToString(j_row_type.getFieldNames()))
+    # getChildren() returns List<DataType>, joined via toString()
+    type_strings = _split_entries(utils.joinToString(j_row_type.getChildren()))
+    return _arrow_schema_from_strings(field_names, type_strings)
+
+
+@functools.lru_cache(maxsize=256)
+def _arrow_schema_from_strings(field_names: Tuple[str, ...], type_strings: Tuple[str, ...]):
+    """Build the PyArrow Schema for field names and Java type strings."""
+    import pyarrow as pa
+    # Convert Java DataType to Arrow DataType
+    return pa.schema([
+        pa.field(field_name, _java_type_to_arrow_type(type_string))
+        for field_name, type_string in zip(field_names, type_strings)
+    ])
+
+
+def _split_entries(encoded: str) -> Tuple[str, ...]:
+    """Split a string produced by FlussPy4JUtils.joinToString."""
+    return tuple(encoded.split(_ENTRY_SEPARATOR)) if encoded else ()
+
+
+_TYPE_ROOT_RE = re.compile(r'[A-Za-z_]+')
+
+
+@functools.lru_cache(maxsize=None)
+def _arrow_types_by_root() -> Dict[str, Any]:
+    """Fluss type root -> Arrow type, built on first use to defer the pyarrow import."""
+    import pyarrow as pa
+    return {
+        'TINYINT': pa.int32(),
+        'SMALLINT': pa.int32(),
+        'INT': pa.int32(),
+        'INTEGER': pa.int32(),
+        'BIGINT': pa.int64(),
+        'STRING': pa.string(),
+        'VARCHAR': pa.string(),
+        'DOUBLE': pa.float64(),
+        'FLOAT': pa.float32(),
+        'BOOLEAN': pa.bool_(),
+        'TIMESTAMP': pa.timestamp('us'),
+        'TIMESTAMP_LTZ': pa.timestamp('us'),
+        'DATE': pa.date32(),
+        'DECIMAL': pa.decimal128(38, 18),  # Default precision and scale
+        'BYTES': pa.binary(),
+        'BINARY': pa.binary(),
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _java_type_to_arrow_type(type_string: str):
+    """Convert a Java DataType string to Arrow DataType."""
+    # The type root is the string up to any length, precision or NOT NULL,
+    # e.g. BIGINT NOT NULL -> BIGINT, DECIMAL(10, 2) -> DECIMAL
+    match = _TYPE_ROOT_RE.match(type_string)
+    type_root = match.group(0).upper() if match else ''
+    arrow_type = _arrow_types_by_root().get(type_root)
+    if arrow_type is None:
         # Default to string for unknown types
-        return pa.string()
+        import pyarrow as pa
+        arrow_type = pa.string()
+    return arrow_type
 
 
 def check_batch_write(j_table):
@@ -0,0 +1,76 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import weakref
+
+# Short name -> fully qualified Java class name
+_JAVA_CLASSES = {
+    'TablePath': 'com.alibaba.fluss.metadata.TablePath',
+    'DatabaseDescriptor': 'com.alibaba.fluss.metadata.DatabaseDescriptor',
+    'TableDescriptor': 'com.alibaba.fluss.metadata.TableDescriptor',
+    'Schema': 'com.alibaba.fluss.metadata.Schema',
+    'DataTypes': 'com.alibaba.fluss.types.DataTypes',
+    'FlussPy4JUtils': 'org.example.FlussPy4JUtils',
+    'FlussClientBridge': 'org.example.FlussClientBridge',
+    'FlussDataWriter': 'org.example.FlussDataWriter',
+    'FlussDataReader': 'org.example.FlussDataReader',
+    'SchemaUtil': 'org.example.SchemaUtil',
+    'MockIdentifier': 'org.example.CatalogFactory.MockIdentifier',
+    'MockCatalogContext': 'org.example.CatalogFactory.MockCatalogContext',
+    'SerializationUtils': 'org.apache.commons.lang3.SerializationUtils',
+    'Object': 'java.lang.Object',
+    'Long': 'java.lang.Long',
+    'Double': 'java.lang.Double',
+    'ArrayList': 'java.util.ArrayList',
+    'TimeUnit': 'java.util.concurrent.TimeUnit',
+}
+
+_cache = weakref.WeakKeyDictionary()
+
+
+class JvmClasses:
+    """
+    Java class handles for one gateway, resolved on first access.
+
+    Each dotted attribute lookup on a JVM view is a Py4J reflection round
+    trip, so resolved handles are kept as plain instance attributes.
+    """
+
+    def __init__(self, gateway):
+        self._jvm = gateway.jvm
+
+    def __getattr__(self, name):
+        class_name = _JAVA_CLASSES.get(name)
+        if class_name is None:
+            raise AttributeError(f"Unknown Java class alias: {name}")
+
+        handle = self._jvm
+        for part in class_name.split('.'):
+            handle = getattr(handle, part)
+        # Later lookups hit the instance dict and skip __getattr__
+        setattr(self, name, handle)
+        return handle
+
+
+def get_jvm_classes(gateway) -> JvmClasses:
+    """Get the cached Java class handles for a gateway."""
+    classes = _cache.get(gateway)
+    if classes is None:
+        classes = JvmClasses(gateway)
+        _cache[gateway] = classes
+    return classes
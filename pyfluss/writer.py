@@ -18,9 +18,13 @@
 
 from typing import List, Dict, Any, Optional
 import logging
+import math
 
 logger = logging.getLogger(__name__)
 
+# Must match org.example.FlussPy4JUtils.SEPARATOR
+_ENTRY_SEPARATOR = '\x00'
+
 class FlussDataWriter:
     """
     High-level data writer for Fluss tables.
@@ -29,6 +33,8 @@ class FlussDataWriter:
     handling type conversions and batch operations automatically.
     """
     
+    __slots__ = ('_java_writer', '_gateway', '_is_closed', '_encoded_writes')
+    
     def __init__(self, java_writer, gateway):
         """
         Initialize the data writer.
@@ -40,6 +46,8 @@ class FlussDataWriter:
         self._java_writer = java_writer
         self._gateway = gateway
         self._is_closed = False
+        # Cleared once the Java writer turns out not to accept encoded rows
+        self._encoded_writes = True
         
     def write_row(self, data: Dict[str, Any]) -> bool:
         """
@@ -54,28 +62,12 @@ class FlussDataWriter:
         self._check_not_closed()
         
         try:
-            # Convert Python dict to Java array
-            # This is a simplified version - in real usage, you'd need to know the schema
-            values = list(data.values())
-            java_row = self._gateway.new_array(self._gateway.jvm.java.lang.Object, len(values))
-            
-            for i, value in enumerate(values):
-                if isinstance(value, int):
-                    java_row[i] = self._gateway.jvm.java.lang.Long(value)
-                elif isinstance(value, float):
-                    java_row[i] = self._gateway.jvm.java.lang.Double(value)
-                else:
-                    java_row[i] = str(value)
-            
-            # Create a single-item list and write it
-            data_list = self._gateway.jvm.java.util.ArrayList()
-            data_list.add(java_row)
-            
-            write_count = self._java_writer.writeDataWithUpsert(data_list)
+            # Same single-call path as write_rows, for a one-row batch
+            write_count = self._write_upsert([data])
             return write_count > 0
             
         except Exception as e:
-            logger.error(f"Error writing row: {e}")
+            logger.error("Error writing row: %s", e)
             return False
             
     def write_rows(self, data_list: List[Dict[str, Any]]) -> int:
@@ -91,32 +83,56 @@ class FlussDataWriter:
         self._check_not_closed()
         
         try:
-            # Convert all rows to Java format
-            java_data_list = self._gateway.jvm.java.util.ArrayList()
-            
-            for row_data in data_list:
-                values = list(row_data.values())
-                java_row = self._gateway.new_array(self._gateway.jvm.java.lang.Object, len(values))
-                
-                for i, value in enumerate(values):
-                    if isinstance(value, int):
-                        java_row[i] = self._gateway.jvm.java.lang.Long(value)
-                    elif isinstance(value, float):
-                        java_row[i] = self._gateway.jvm.java.lang.Double(value)
-                    else:
-                        java_row[i] = str(value)
-                
-                java_data_list.add(java_row)
-            
-            # Write all rows in one batch
-            write_count = self._java_writer.writeDataWithUpsert(java_data_list)
-            logger.info(f"Successfully wrote {write_count}/{len(data_list)} rows")
+            write_count = self._write_upsert(data_list)
+            logger.info("Successfully wrote %d/%d rows", write_count, len(data_list))
             return write_count
             
         except Exception as e:
-            logger.error(f"Error writing rows: {e}")
+            logger.error("Error writing rows: %s", e)
             return 0
         
+    def _write_upsert(self, data_list: List[Dict[str, Any]]) -> int:
+        """Upsert rows, preferring a single encoded call over per-value calls."""
+        from py4j.protocol import Py4JError, Py4JJavaError, Py4JNetworkError
+        encoded = _encode_rows(data_list) if self._encoded_writes else None
+        if encoded is not None:
+            try:
+                # The whole batch goes over as one string in one call
+                return self._java_writer.writeEncodedDataWithUpsert(encoded)
+            except (Py4JJavaError, Py4JNetworkError):
+                # Failures of the call itself, not a missing method
+                raise
+            except Py4JError:
+                # Java writer without encoded row support
+                self._encoded_writes = False
+        return self._write_java_rows(data_list)
+        
+    def _write_java_rows(self, data_list: List[Dict[str, Any]]) -> int:
+        """Write rows by building each Java value individually over the gateway."""
+        from .py4j.util.jvm_cache import get_jvm_classes
+        jvm_classes = get_jvm_classes(self._gateway)
+        java_data_list = jvm_classes.ArrayList()
+        # Bound once so the per-value loop does no Python attribute lookups
+        new_array = self._gateway.new_array
+        java_object, java_long, java_double = jvm_classes.Object, jvm_classes.Long, jvm_classes.Double
+        add_row = java_data_list.add
+        
+        for row_data in data_list:
+            values = list(row_data.values())
+            java_row = new_array(java_object, len(values))
+            
+            for i, value in enumerate(values):
+                if isinstance(value, int):
+                    java_row[i] = java_long(value)
+                elif isinstance(value, float):
+                    java_row[i] = java_double(value)
+                else:
+                    java_row[i] = str(value)
+            
+            add_row(java_row)
+        
+        return self._java_writer.writeDataWithUpsert(java_data_list)
+        
     def flush(self):
         """Force flush any buffered data."""
         self._check_not_closed()
@@ -131,7 +147,7 @@ class FlussDataWriter:
                 self._is_closed = True
                 logger.debug("Data writer closed")
             except Exception as e:
-                logger.error(f"Error closing writer: {e}")
+                logger.error("Error closing writer: %s", e)
                 
     def __enter__(self):
         """Context manager entry."""
@@ -145,7 +161,42 @@ class FlussDataWriter:
         """Check if writer is still open."""
         if self._is_closed:
             raise RuntimeError("Writer has been closed")
-            
-    def __del__(self):
-        """Destructor to ensure cleanup."""
-        self.close()
+
+
+def _encode_rows(data_list: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Encode rows in the format of org.example.FlussPy4JUtils.buildRows.
+    
+    Args:
+        data_list: List of dictionaries, each containing column_name -> value mappings
+        
+    Returns:
+        Encoded rows, or None if a string value contains the separator
+    """
+    parts = []
+    for row_data in data_list:
+        parts.append(str(len(row_data)))
+        for value in row_data.values():
+            if value is None:
+                parts.append('N')
+            elif isinstance(value, bool):
+                parts.append('B' + ('true' if value else 'false'))
+            elif isinstance(value, int):
+                parts.append('L' + str(value))
+            elif isinstance(value, float):
+                parts.append('D' + _java_double_literal(value))
+            else:
+                text = str(value)
+                if _ENTRY_SEPARATOR in text:
+                    return None
+                parts.append('S' + text)
+    return _ENTRY_SEPARATOR.join(parts)
+
+
+def _java_double_literal(value: float) -> str:
+    """Format a float so that java.lang.Double.valueOf parses it back exactly."""
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return 'Infinity' if value > 0 else '-Infinity'
+    return repr(value)
@@ -19,7 +19,7 @@
 import os
 import sys
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 this_directory = os.path.abspath(os.path.dirname(__file__))
 version_file = os.path.join(this_directory, 'pyfluss/version.py')
@@ -43,6 +43,8 @@ PACKAGES = [
 ]
 
 install_requires = [
+    # 0.10.9.3+ reads gateway replies through a buffered socket file instead of
+    # one recv per byte, which matters for large collection/schema replies
     'py4j==0.10.9.7',
 ]
 
@@ -53,13 +55,15 @@ extras_require = {
     'pandas': [
         'pandas>=1.3.0'
     ],
-    'all': [
-        'pyarrow>=5.0.0',
-        'pandas>=1.3.0',
-        'duckdb>=0.5.0,<2.0.0',
+    'duckdb': [
+        'duckdb>=0.5.0,<2.0.0'
+    ],
+    # Kept out of 'all', Ray is a very large install most users never need
+    'ray': [
         'ray~=2.10.0'
     ]
 }
+extras_require['all'] = extras_require['arrow'] + extras_require['pandas'] + extras_require['duckdb']
 
 long_description = '''
 PyFluss - Python SDK for Apache Fluss
@@ -78,7 +82,8 @@ setup(
     name='pyfluss',
     version=VERSION,
     packages=PACKAGES,
-    include_package_data=True,
+    # PACKAGES and package_data list everything shipped, so skip the MANIFEST scan
+    include_package_data=False,
     # JAR files will be included in package
     package_dir={
         "pyfluss.jars": "pyfluss/jars"
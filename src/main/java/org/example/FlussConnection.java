@@ -5,6 +5,9 @@ import com.alibaba.fluss.client.admin.Admin;
 import com.alibaba.fluss.client.table.Table;
 import com.alibaba.fluss.metadata.TablePath;
 
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+
 /**
  * Simplified connection wrapper - exposes only necessary Fluss objects
  * No business logic, focuses on object access only
@@ -12,6 +15,8 @@ import com.alibaba.fluss.metadata.TablePath;
 public class FlussConnection {
     private final Connection connection;
     private final Admin admin;
+    // FlussDataWriter 只持有 Table 和 RowType，可以在调用之间共享
+    private final Map<TablePath, FlussDataWriter> dataWriters = new ConcurrentHashMap<>();
     
     public FlussConnection(Connection connection) {
         this.connection = connection;
@@ -33,6 +38,29 @@ public class FlussConnection {
         return connection.getTable(tablePath);
     }
     
+    /**
+     * 获取表的数据写入器，同一张表复用同一个实例
+     */
+    public FlussDataWriter getDataWriter(String database, String tableName) {
+        TablePath tablePath = TablePath.of(database, tableName);
+        return dataWriters.computeIfAbsent(
+            tablePath, path -> new FlussDataWriter(connection.getTable(path)));
+    }
+    
+    /**
+     * 丢弃表的缓存写入器（例如表被删除后）
+     */
+    public void evictDataWriter(String database, String tableName) {
+        dataWriters.remove(TablePath.of(database, tableName));
+    }
+    
+    /**
+     * 丢弃数据库下所有表的缓存写入器（例如数据库被级联删除后）
+     */
+    public void evictDataWriters(String database) {
+        dataWriters.keySet().removeIf(path -> path.getDatabaseName().equals(database));
+    }
+    
     /**
      * 获取原始连接对象（高级用法）
      */
@@ -0,0 +1,67 @@
+package org.example;
+
+import java.util.concurrent.atomic.AtomicInteger;
+
+/**
+ * Fixed set of Fluss connections handed out round-robin
+ * Python binds one connection per thread so concurrent writers and readers
+ * do not all funnel through a single connection
+ */
+public class FlussConnectionPool {
+    private final FlussConnection[] connections;
+    private final AtomicInteger next = new AtomicInteger();
+    
+    public FlussConnectionPool(FlussConnection[] connections) {
+        this.connections = connections;
+    }
+    
+    /**
+     * 取出下一个连接，连接始终归连接池所有，无需归还
+     */
+    public FlussConnection borrow() {
+        int index = Math.floorMod(next.getAndIncrement(), connections.length);
+        return connections[index];
+    }
+    
+    /**
+     * 连接池大小
+     */
+    public int size() {
+        return connections.length;
+    }
+    
+    /**
+     * 在所有连接上丢弃表的缓存写入器
+     */
+    public void evictDataWriter(String database, String tableName) {
+        for (FlussConnection connection : connections) {
+            connection.evictDataWriter(database, tableName);
+        }
+    }
+    
+    /**
+     * 在所有连接上丢弃数据库下所有表的缓存写入器
+     */
+    public void evictDataWriters(String database) {
+        for (FlussConnection connection : connections) {
+            connection.evictDataWriters(database);
+        }
+    }
+    
+    /**
+     * 关闭池中所有连接
+     */
+    public void close() {
+        RuntimeException failure = null;
+        for (FlussConnection connection : connections) {
+            try {
+                connection.close();
+            } catch (RuntimeException e) {
+                failure = e;
+            }
+        }
+        if (failure != null) {
+            throw failure;
+        }
+    }
+}
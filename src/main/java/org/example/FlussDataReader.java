@@ -9,6 +9,7 @@ import com.alibaba.fluss.client.table.scanner.log.ScanRecords;
 import com.alibaba.fluss.metadata.TableBucket;
 import com.alibaba.fluss.metadata.TableInfo;
 import com.alibaba.fluss.row.InternalRow;
+import com.alibaba.fluss.types.DataType;
 import com.alibaba.fluss.types.RowType;
 import com.alibaba.fluss.utils.CloseableIterator;
 
@@ -102,6 +103,58 @@ public class FlussDataReader {
         return results;
     }
     
+    /**
+     * 读取批量数据并按类型编码为单个字符串，Python 端一次调用即可拿到整批数据
+     * @param limit 限制读取的记录数
+     * @return 每行依次为 getTableSchema() 各字段的 FlussPy4JUtils 编码值，以 SEPARATOR 分隔；
+     *         字符串值含有 SEPARATOR 时返回 null，调用方需改用 readBatchData
+     */
+    public String readBatchDataEncoded(int limit) {
+        StringBuilder builder = new StringBuilder();
+        BatchScanner scanner = null;
+        
+        try {
+            scanner = createBatchScanner(limit);
+            RowType rowType = getTableSchema();
+            List<DataType> fieldTypes = rowType.getChildren();
+            Duration timeout = Duration.ofSeconds(10);
+            CloseableIterator<InternalRow> iterator = scanner.pollBatch(timeout);
+            
+            if (iterator != null) {
+                int rowCount = 0;
+                while (iterator.hasNext() && rowCount < limit) {
+                    InternalRow row = iterator.next();
+                    for (int i = 0; i < fieldTypes.size(); i++) {
+                        if (builder.length() > 0) {
+                            builder.append(FlussPy4JUtils.SEPARATOR);
+                        }
+                        Object value = SchemaUtil.getFieldValuePublic(row, i, fieldTypes.get(i));
+                        if (!FlussPy4JUtils.appendValue(builder, value)) {
+                            iterator.close();
+                            return null;
+                        }
+                    }
+                    rowCount++;
+                }
+                iterator.close();
+            }
+            
+        } catch (Exception e) {
+            throw new RuntimeException("Failed to read batch data: " + e.getMessage(), e);
+        } finally {
+            if (scanner != null) {
+                try {
+                    scanner.close();
+                } catch (IOException e) {
+                    // Log but don't throw
+                    System.err.println("Error closing scanner: " + e.getMessage());
+                }
+            }
+        }
+        
+        return builder.toString();
+    }
+    
     /**
      * 读取流数据
      * @param timeout 超时时间（毫秒）
@@ -145,6 +198,44 @@ public class FlussDataReader {
         return results;
     }
     
+    /**
+     * 在 JVM 端统计与 readBatchData 相同的有限批量扫描会返回的行数，避免逐行经过 Py4J 传输
+     * @param limit 限制统计的记录数
+     * @return 记录数，最多为 limit
+     */
+    public int countBatchRecords(int limit) {
+        int count = 0;
+        BatchScanner scanner = null;
+        
+        try {
+            scanner = createBatchScanner(limit);
+            Duration timeout = Duration.ofSeconds(10);
+            CloseableIterator<InternalRow> iterator = scanner.pollBatch(timeout);
+            
+            if (iterator != null) {
+                while (iterator.hasNext() && count < limit) {
+                    iterator.next();
+                    count++;
+                }
+                iterator.close();
+            }
+            
+        } catch (Exception e) {
+            throw new RuntimeException("Failed to count records: " + e.getMessage(), e);
+        } finally {
+            if (scanner != null) {
+                try {
+                    scanner.close();
+                } catch (IOException e) {
+                    // Log but don't throw
+                    System.err.println("Error closing scanner: " + e.getMessage());
+                }
+            }
+        }
+        
+        return count;
+    }
+    
     /**
      * 获取表模式信息
      * @return RowType
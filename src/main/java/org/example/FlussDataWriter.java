@@ -88,6 +88,15 @@ public class FlussDataWriter {
         return writeCount;
     }
     
+    /**
+     * 使用UpsertWriter写入Python端一次性编码的数据，避免逐个单元格的Py4J调用
+     * @param encoded FlussPy4JUtils.buildRows格式的编码字符串
+     * @return 写入的记录数
+     */
+    public int writeEncodedDataWithUpsert(String encoded) {
+        return writeDataWithUpsert(FlussPy4JUtils.buildRows(encoded));
+    }
+    
     /**
      * 使用AppendWriter写入数据
      * @param data 数据行列表，每行是Object[]
@@ -64,6 +64,36 @@ public class FlussGateway {
         }
     }
     
+    /**
+     * 创建 Fluss 连接池
+     * @param bootstrapServers 引导服务器地址，例如 "localhost:9123"
+     * @param size 连接数量
+     * @return FlussConnectionPool 实例
+     */
+    public FlussConnectionPool createConnectionPool(String bootstrapServers, int size) {
+        if (size < 1) {
+            throw new IllegalArgumentException("Connection pool size must be positive: " + size);
+        }
+        FlussConnection[] connections = new FlussConnection[size];
+        try {
+            for (int i = 0; i < size; i++) {
+                connections[i] = createConnection(bootstrapServers);
+            }
+        } catch (RuntimeException e) {
+            for (FlussConnection connection : connections) {
+                if (connection != null) {
+                    try {
+                        connection.close();
+                    } catch (RuntimeException ignored) {
+                        // keep the original failure
+                    }
+                }
+            }
+            throw e;
+        }
+        return new FlussConnectionPool(connections);
+    }
+    
     /**
      * 获取 Schema 工具类
      * @return SchemaUtil 实例
@@ -0,0 +1,208 @@
+package org.example;
+
+import com.alibaba.fluss.client.table.Table;
+import com.alibaba.fluss.metadata.TableBucket;
+import com.alibaba.fluss.metadata.TableInfo;
+import com.alibaba.fluss.types.DataField;
+
+import java.io.ByteArrayOutputStream;
+import java.io.IOException;
+import java.io.ObjectOutputStream;
+import java.util.ArrayList;
+import java.util.Base64;
+import java.util.Collection;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * Py4J transfer helpers - move whole collections across the bridge in one call
+ * instead of one socket round trip per element
+ */
+public class FlussPy4JUtils {
+
+    /** Separator between flattened entries, must match the Python side */
+    public static final String SEPARATOR = "\u0000";
+
+    /**
+     * 从扁平化字符串构建 Map
+     * @param encoded key1 SEP value1 SEP key2 SEP value2 ...
+     * @return Map<String, String>
+     */
+    public static Map<String, String> buildStringMap(String encoded) {
+        Map<String, String> result = new HashMap<>();
+        if (encoded == null || encoded.isEmpty()) {
+            return result;
+        }
+
+        String[] parts = encoded.split(SEPARATOR, -1);
+        if (parts.length % 2 != 0) {
+            throw new IllegalArgumentException("Encoded map must contain an even number of entries");
+        }
+        for (int i = 0; i < parts.length; i += 2) {
+            result.put(parts[i], parts[i + 1]);
+        }
+        return result;
+    }
+
+    /**
+     * 从扁平化字符串构建 String 数组
+     * @param encoded element1 SEP element2 ...
+     * @return String[]
+     */
+    public static String[] buildStringArray(String encoded) {
+        if (encoded == null || encoded.isEmpty()) {
+            return new String[0];
+        }
+        return encoded.split(SEPARATOR, -1);
+    }
+
+    /**
+     * 从扁平化字符串构建 int 数组
+     * @param encoded int1 SEP int2 ...
+     * @return int[]
+     */
+    public static int[] buildIntArray(String encoded) {
+        String[] parts = buildStringArray(encoded);
+        int[] result = new int[parts.length];
+        for (int i = 0; i < parts.length; i++) {
+            result[i] = Integer.parseInt(parts[i]);
+        }
+        return result;
+    }
+
+    /**
+     * 从扁平化字符串构建多行数据
+     * 每行以列数开头，随后每个值带类型前缀：L=Long, D=Double, B=Boolean, S=String, N=null
+     * @param encoded count1 SEP value1_1 SEP ... SEP count2 SEP value2_1 ...
+     * @return 数据行列表，每行是Object[]
+     */
+    public static List<Object[]> buildRows(String encoded) {
+        List<Object[]> rows = new ArrayList<>();
+        String[] parts = buildStringArray(encoded);
+        int pos = 0;
+        while (pos < parts.length) {
+            Object[] row = new Object[Integer.parseInt(parts[pos++])];
+            for (int i = 0; i < row.length; i++) {
+                row[i] = decodeValue(parts[pos++]);
+            }
+            rows.add(row);
+        }
+        return rows;
+    }
+
+    private static Object decodeValue(String part) {
+        String value = part.substring(1);
+        switch (part.charAt(0)) {
+            case 'L':
+                return Long.valueOf(value);
+            case 'D':
+                return Double.valueOf(value);
+            case 'B':
+                return Boolean.valueOf(value);
+            case 'S':
+                return value;
+            case 'N':
+                return null;
+            default:
+                throw new IllegalArgumentException("Unknown value type prefix: " + part.charAt(0));
+        }
+    }
+
+    /**
+     * 以 buildRows 的类型前缀编码单个值，null 编码为 N
+     * @param builder 目标 StringBuilder
+     * @param value 字段值
+     * @return 字符串值中含有 SEPARATOR 无法编码时返回 false，此时 builder 不变
+     */
+    public static boolean appendValue(StringBuilder builder, Object value) {
+        if (value == null) {
+            builder.append('N');
+        } else if (value instanceof Long || value instanceof Integer
+                || value instanceof Short || value instanceof Byte) {
+            builder.append('L').append(value);
+        } else if (value instanceof Double || value instanceof Float) {
+            builder.append('D').append(value);
+        } else if (value instanceof Boolean) {
+            builder.append('B').append(value);
+        } else {
+            String text = value.toString();
+            if (text.contains(SEPARATOR)) {
+                return false;
+            }
+            builder.append('S').append(text);
+        }
+        return true;
+    }
+
+    /**
+     * 将集合元素扁平化为单个字符串，Python 端按 SEPARATOR 拆分
+     * @param collection Java 集合
+     * @return element1 SEP element2 ...
+     */
+    public static String joinToString(Collection<?> collection) {
+        StringBuilder builder = new StringBuilder();
+        boolean first = true;
+        for (Object element : collection) {
+            if (!first) {
+                builder.append(SEPARATOR);
+            }
+            builder.append(element);
+            first = false;
+        }
+        return builder.toString();
+    }
+
+    /**
+     * 将表的列信息与主键扁平化为单个字符串
+     * @param table Fluss 表
+     * @return columnCount SEP name1 SEP type1 SEP nullable1 ... SEP primaryKey1 ...
+     */
+    public static String describeTable(Table table) {
+        TableInfo tableInfo = table.getTableInfo();
+        List<DataField> fields = tableInfo.getRowType().getFields();
+        StringBuilder builder = new StringBuilder();
+        builder.append(fields.size());
+        for (DataField field : fields) {
+            builder.append(SEPARATOR).append(field.getName())
+                    .append(SEPARATOR).append(field.getType())
+                    .append(SEPARATOR).append(field.getType().isNullable());
+        }
+        for (String primaryKey : tableInfo.getPrimaryKeys()) {
+            builder.append(SEPARATOR).append(primaryKey);
+        }
+        return builder.toString();
+    }
+
+    /**
+     * 将 TableBucket 列表扁平化为单个字符串，序列化后的对象以 Base64 编码
+     * @param buckets TableBucket 列表
+     * @return bucketId1 SEP partitionId1 SEP serialized1 SEP bucketId2 ...
+     */
+    public static String describeBuckets(Collection<TableBucket> buckets) {
+        StringBuilder builder = new StringBuilder();
+        Base64.Encoder encoder = Base64.getEncoder();
+        boolean first = true;
+        for (TableBucket bucket : buckets) {
+            if (!first) {
+                builder.append(SEPARATOR);
+            }
+            Long partitionId = bucket.getPartitionId();
+            builder.append(bucket.getBucket())
+                    .append(SEPARATOR).append(partitionId == null ? "" : partitionId.toString())
+                    .append(SEPARATOR).append(encoder.encodeToString(serialize(bucket)));
+            first = false;
+        }
+        return builder.toString();
+    }
+
+    private static byte[] serialize(Object object) {
+        ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+        try (ObjectOutputStream out = new ObjectOutputStream(bytes)) {
+            out.writeObject(object);
+        } catch (IOException e) {
+            throw new RuntimeException("Failed to serialize " + object, e);
+        }
+        return bytes.toByteArray();
+    }
+}
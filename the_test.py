@@ -3,7 +3,6 @@
 PyFluss comprehensive test script with Schema support.
 """
 
-import pandas as pd
 import pyarrow as pa
 from pyfluss import connect
 from pyfluss.api import Schema, DatabaseDescriptor
@@ -58,8 +57,7 @@ test_data = [
 
 # 目前都是 write_row，实际上都是 upsert
 # 应该根据表实际的类型选择是 upsert 还是 append
-for record in test_data:
-    writer.write_row(record)
+writer.write_rows(test_data)
 
 # 这个 close 目前也不干任何事情
 writer.close()
@@ -73,8 +71,8 @@ try:
     # 而且目前 reader 也都是 batch_reader
     data = reader.read_rows(limit=10)
     if data:
-        for i, record in enumerate(data):
-            print(f"Record {i+1}: {record}")
+        # One write for all records instead of one print per record
+        print("\n".join(f"Record {i+1}: {record}" for i, record in enumerate(data)))
         print(f"Successfully read {len(data)} records")
     else:
         print("No data found in table")